@@ -1,5 +1,12 @@
 from queue import PriorityQueue
 
+from dstar_lite import DStarLite
+from flow_field import FlowField
+from grid_astar import GridAStar
+from jump_point_search import jump_point_search
+from path_cache import PathCache
+from weighted_grid import WeightedGridAStar
+
 class Node:
     def __init__(self, row, col):
         self.row = row
@@ -115,3 +122,40 @@ if a_star(draw_placeholder, grid, start, end):
     print("Path found!")
 else:
     print("No path available.")
+
+# Same query on the array-backed engine: no Node objects, state reused across calls
+engine = GridAStar.from_layout(grid_layout)
+print("Array engine path:", engine.find_path(start.get_pos(), end.get_pos()))
+print("Jump Point Search path:", jump_point_search(grid, start, end))
+print("Jump Point Search path (diagonal):", jump_point_search(grid, start, end, diagonal=True))
+
+# Repeated queries through the path cache; a new wall only drops the paths crossing it
+cache = PathCache(engine.find_path)
+for _ in range(3):
+    cache.find_path(start.get_pos(), end.get_pos())
+engine.set_blocked(2, 4)
+cache.cell_blocked((2, 4))
+print("Cached path after blocking (2, 4):", cache.find_path(start.get_pos(), end.get_pos()))
+print("Cache stats:", cache.stats())
+
+# Incremental replanning: the planner keeps its search, a new wall only repairs what it affects
+planner = DStarLite.from_layout(grid_layout, start.get_pos(), end.get_pos())
+print("D* Lite path:", planner.find_path())
+planner.set_blocked(1, 4)
+print(f"D* Lite path after blocking (1, 4), {planner.expanded} vertices re-expanded:", planner.find_path())
+
+# Many units, one goal: a single reverse search gives every cell its next step
+field = FlowField(GridAStar.from_layout(grid_layout), end.get_pos())
+print("Flow field path from S:", field.find_path(start.get_pos()))
+print("Flow field next step from (2, 0):", field.next_step((2, 0)), "distance", field.distance_to_goal((2, 0)))
+
+# Terrain costs: digits are the cost of entering a cell, "." costs 1; the bucket queue finds the cheapest route
+terrain_layout = [
+    [".", "9", "9", ".", "."],
+    [".", "#", "2", "#", "."],
+    [".", "5", ".", "#", "."],
+    [".", "#", "#", "#", "."],
+    [".", ".", "3", ".", "."],
+]
+terrain = WeightedGridAStar.from_layout(terrain_layout)
+print("Weighted terrain path:", terrain.find_path(start.get_pos(), end.get_pos()), "cost", terrain.cost)
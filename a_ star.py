@@ -1,6 +1,7 @@
 import pygame
-import math
-from queue import PriorityQueue
+
+from dstar_lite import DStarLite
+from grid_astar import CLOSED, OPENED, PATH, GridAStar
 
 # Window setup
 SCREEN_SIZE = 800
@@ -25,7 +26,6 @@ class Node:
         self.y = col * size
         self.size = size
         self.color = COLOR_BG
-        self.neighbors = []
         self.total_rows = total_rows
 
     def get_pos(self):
@@ -50,81 +50,6 @@ class Node:
     def draw(self, surface):
         pygame.draw.rect(surface, self.color, (self.x, self.y, self.size, self.size))
 
-    def update_neighbors(self, grid):
-        self.neighbors.clear()
-        # Down
-        if self.row < self.total_rows - 1 and not grid[self.row + 1][self.col].is_barrier():
-            self.neighbors.append(grid[self.row + 1][self.col])
-        # Up
-        if self.row > 0 and not grid[self.row - 1][self.col].is_barrier():
-            self.neighbors.append(grid[self.row - 1][self.col])
-        # Right
-        if self.col < self.total_rows - 1 and not grid[self.row][self.col + 1].is_barrier():
-            self.neighbors.append(grid[self.row][self.col + 1])
-        # Left
-        if self.col > 0 and not grid[self.row][self.col - 1].is_barrier():
-            self.neighbors.append(grid[self.row][self.col - 1])
-
-    def __lt__(self, other):
-        return False  # Not used for direct comparison
-
-# Manhattan distance heuristic
-def heuristic(a, b):
-    x1, y1 = a
-    x2, y2 = b
-    return abs(x2 - x1) + abs(y2 - y1)
-
-# Reconstructs path
-def build_path(origin, current, draw):
-    while current in origin:
-        current = origin[current]
-        current.set_path()
-        draw()
-
-# A* Search Implementation
-def a_star(draw, grid, start, goal):
-    counter = 0
-    open_nodes = PriorityQueue()
-    open_nodes.put((0, counter, start))
-    came_from = {}
-    g_cost = {node: float("inf") for row in grid for node in row}
-    f_cost = {node: float("inf") for row in grid for node in row}
-    g_cost[start] = 0
-    f_cost[start] = heuristic(start.get_pos(), goal.get_pos())
-
-    open_set_tracker = {start}
-
-    while not open_nodes.empty():
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-
-        current = open_nodes.get()[2]
-        open_set_tracker.remove(current)
-
-        if current == goal:
-            build_path(came_from, goal, draw)
-            goal.set_goal()
-            return True
-
-        for neighbor in current.neighbors:
-            temp_g = g_cost[current] + 1
-            if temp_g < g_cost[neighbor]:
-                came_from[neighbor] = current
-                g_cost[neighbor] = temp_g
-                f_cost[neighbor] = temp_g + heuristic(neighbor.get_pos(), goal.get_pos())
-                if neighbor not in open_set_tracker:
-                    counter += 1
-                    open_nodes.put((f_cost[neighbor], counter, neighbor))
-                    open_set_tracker.add(neighbor)
-                    neighbor.set_open()
-
-        draw()
-        if current != start:
-            current.set_closed()
-
-    return False
-
 # Grid creation
 def create_grid(rows, size):
     grid = []
@@ -140,29 +65,102 @@ def draw_grid(surface, rows, size):
     for j in range(rows):
         pygame.draw.line(surface, COLOR_GRID, (j * gap, 0), (j * gap, size))
 
-def render(surface, grid, rows, size):
-    surface.fill(COLOR_BG)
-    for row in grid:
-        for node in row:
-            node.draw(surface)
-    draw_grid(surface, rows, size)
-    pygame.display.update()
+class GridRenderer:
+    """
+    Redraws only the nodes that changed since the last frame (dirty rects).
+    Grid lines are drawn once onto a cached overlay and blitted back over
+    each redrawn cell, so a frame costs O(changed cells), not O(grid).
+    """
+    LINE_KEY = (255, 0, 255)  # Transparent colour of the line overlay
+
+    def __init__(self, surface, grid, rows, size):
+        self.surface = surface
+        self.grid = grid
+        self.lines = pygame.Surface((size, size))
+        self.lines.fill(self.LINE_KEY)
+        self.lines.set_colorkey(self.LINE_KEY)
+        draw_grid(self.lines, rows, size)
+        self.dirty = []
+
+    def mark(self, node):
+        self.dirty.append(node)
+
+    def full_redraw(self):
+        self.surface.fill(COLOR_BG)
+        for row in self.grid:
+            for node in row:
+                node.draw(self.surface)
+        self.surface.blit(self.lines, (0, 0))
+        pygame.display.update()
+        self.dirty.clear()
+
+    def flush(self):
+        if not self.dirty:
+            return
+        rects = []
+        for node in self.dirty:
+            node.draw(self.surface)
+            rect = pygame.Rect(node.x, node.y, node.size, node.size)
+            self.surface.blit(self.lines, rect, rect)
+            rects.append(rect)
+        pygame.display.update(rects)
+        self.dirty.clear()
+
+    def play(self, events, start, goal, events_per_frame=40, fps=60):
+        """
+        Replay a search event stream, applying a fixed batch of events per
+        frame. Returns False if the window was closed during playback.
+        """
+        clock = pygame.time.Clock()
+        setters = {OPENED: Node.set_open, CLOSED: Node.set_closed, PATH: Node.set_path}
+        for index, (kind, row, col) in enumerate(events, 1):
+            node = self.grid[row][col]
+            if node != start and node != goal:
+                setters[kind](node)
+                self.mark(node)
+            if index % events_per_frame == 0:
+                self.flush()
+                clock.tick(fps)
+                if pygame.event.peek(pygame.QUIT):
+                    return False
+        self.flush()
+        return True
 
 def get_cell_clicked(pos, rows, size):
     gap = size // rows
     y, x = pos
     return y // gap, x // gap
 
+def show_path(path, grid, start, goal, shown, renderer):
+    # Clear the previous route before painting the new one
+    for node in shown:
+        if node.color == COLOR_PATH:
+            node.reset()
+            renderer.mark(node)
+    shown.clear()
+    for row, col in path or ():
+        node = grid[row][col]
+        if node != start and node != goal:
+            node.set_path()
+            shown.append(node)
+            renderer.mark(node)
+
 def main(surface, size):
     ROWS = 50
     grid = create_grid(ROWS, size)
 
     start = None
     goal = None
+    planner = None  # Incremental D* Lite search, kept between SPACE presses
+    shown_path = []
+    renderer = GridRenderer(surface, grid, ROWS, size)
+    renderer.full_redraw()
+    clock = pygame.time.Clock()
 
     running = True
     while running:
-        render(surface, grid, ROWS, size)
+        renderer.flush()
+        clock.tick(60)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
@@ -172,37 +170,60 @@ def main(surface, size):
                 pos = pygame.mouse.get_pos()
                 row, col = get_cell_clicked(pos, ROWS, size)
                 node = grid[row][col]
+                renderer.mark(node)
                 if not start and node != goal:
                     start = node
                     start.set_start()
+                    planner = None
                 elif not goal and node != start:
                     goal = node
                     goal.set_goal()
+                    planner = None
                 elif node != start and node != goal:
                     node.set_barrier()
+                    if planner:
+                        planner.set_blocked(row, col)
 
             # Right mouse: reset node
             elif pygame.mouse.get_pressed()[2]:
                 pos = pygame.mouse.get_pos()
                 row, col = get_cell_clicked(pos, ROWS, size)
                 node = grid[row][col]
+                renderer.mark(node)
+                if planner and node.is_barrier():
+                    planner.set_blocked(row, col, False)
                 node.reset()
                 if node == start:
                     start = None
+                    planner = None
                 elif node == goal:
                     goal = None
+                    planner = None
 
             if event.type == pygame.KEYDOWN:
+                # SPACE: replan incrementally, only the cells changed since the last plan are repaired
                 if event.key == pygame.K_SPACE and start and goal:
-                    for row in grid:
-                        for node in row:
-                            node.update_neighbors(grid)
-                    a_star(lambda: render(surface, grid, ROWS, size), grid, start, goal)
+                    if planner is None:
+                        planner = DStarLite(GridAStar.from_grid(grid), start.get_pos(), goal.get_pos())
+                    show_path(planner.find_path(), grid, start, goal, shown_path, renderer)
+
+                # A: full A* search from scratch, run headless then replayed frame by frame
+                if event.key == pygame.K_a and start and goal:
+                    events = list(GridAStar.from_grid(grid).search_events(start.get_pos(), goal.get_pos()))
+                    if not renderer.play([event for event in events if event[0] != PATH], start, goal):
+                        running = False
+                    # The route goes through show_path so the next redraw clears it
+                    path = [(row, col) for kind, row, col in events if kind == PATH]
+                    show_path(path, grid, start, goal, shown_path, renderer)
 
                 if event.key == pygame.K_c:
                     start = None
                     goal = None
+                    planner = None
+                    shown_path.clear()
                     grid = create_grid(ROWS, size)
+                    renderer.grid = grid
+                    renderer.full_redraw()
 
     pygame.quit()
 
@@ -1,5 +1,6 @@
-import pygame
 import random
+import time
+from array import array
 from collections import deque
 
 # Screen setup
@@ -8,80 +9,288 @@ CELL_SIZE = 20
 ROWS = HEIGHT // CELL_SIZE
 COLS = WIDTH // CELL_SIZE
 
-pygame.init()
-WIN = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Snake Game AI")
+# Created in main(), so the game logic can be imported and run headless
+WIN = None
 
 # Colors
 BLACK = (0, 0, 0)
 GREEN = (0, 255, 0)
 RED = (255, 0, 0)
 
+# Planner modes for SnakeGameAI
+BFS = "bfs"  # Shortest path to the food, first free neighbour if there is none
+SURVIVAL = "survival"  # Only take food paths that leave the tail reachable, stall otherwise
+
+
+def hamiltonian_cycle(cols, rows):
+    """
+    Next cell (y * cols + x) for every cell on a cycle visiting the whole
+    board, or None when there is no such cycle (both sides odd, or a side of 1).
+
+    Rows are swept back and forth over columns 1.. and column 0 is the
+    lane back to the top; with an odd number of rows we sweep columns instead.
+    """
+    if cols < 2 or rows < 2 or (cols % 2 and rows % 2):
+        return None
+    transpose = rows % 2 == 1
+    if transpose:
+        cols, rows = rows, cols
+    order = [(0, 0)]
+    for y in range(rows):
+        xs = range(1, cols) if y % 2 == 0 else range(cols - 1, 0, -1)
+        order += [(x, y) for x in xs]
+    order += [(0, y) for y in range(rows - 1, 0, -1)]
+    if transpose:
+        cols, rows = rows, cols
+        order = [(y, x) for x, y in order]
+
+    next_cell = array('i', bytes(4 * cols * rows))
+    for (x, y), (next_x, next_y) in zip(order, order[1:] + order[:1]):
+        next_cell[y * cols + x] = next_y * cols + next_x
+    return next_cell
+
+
 class SnakeGameAI:
-    def __init__(self):
+    def __init__(self, seed=None, cols=COLS, rows=ROWS, reuse_path=True, planner=BFS):
+        """
+        reuse_path: follow the cached route while it stays valid instead of
+        searching every step. The route is still a shortest one, but it can
+        break ties differently from a fresh search, so games diverge from
+        reuse_path=False ones; snake_batch.SnakeBatch replays only reuse_path=False.
+        """
+        # Private RNG: the same seed always replays the same food positions
+        self.rng = random.Random(seed)
+        self.cols = cols
+        self.rows = rows
+        # Follow the last BFS path until the food moves instead of searching every step
+        self.reuse_path = reuse_path
+        if planner not in (BFS, SURVIVAL):
+            raise ValueError(f"Unknown planner {planner!r}")
+        self.planner = planner
+        self.cycle_next = hamiltonian_cycle(cols, rows) if planner == SURVIVAL else None
+        cells = cols * rows
+        # BFS scratch space, allocated once and reused: parent cell and visit stamp per cell
+        self.came_from = array('i', bytes(4 * cells))
+        self.visited = array('I', bytes(4 * cells))
+        self.bfs_queue = array('i', bytes(4 * cells))
+        self.bfs_dist = array('i', bytes(4 * cells))
+        self.search_id = 0
         self.reset()
 
     def reset(self):
-        self.snake = deque([(5, 5)])
+        cells = self.cols * self.rows
+        # Occupancy bitmap (cell = y * cols + x) kept in step with the deque for O(1) body tests,
+        # plus every free cell in a list with each cell's position in it, for O(1) food spawning
+        self.occupied = bytearray(cells)
+        self.free_cells = list(range(cells))
+        self.free_index = list(range(cells))
+        start = (self.cols // 2, self.rows // 2)  # Centre, so every board size has room to turn
+        self.snake = deque([start])
+        self._occupy(start)
         self.direction = (1, 0)
         self.spawn_food()
         self.score = 0
+        self.replans = 0  # Searches run this game
+        self.reused_steps = 0  # Steps taken from a cached path instead
+        self.path = []  # Cached route to the food, reversed so the next cell is path[-1]
+        self.path_head = None  # Where the head should be if we are still on that route
+
+    def _occupy(self, pos):
+        cell = pos[1] * self.cols + pos[0]
+        self.occupied[cell] = 1
+        # Swap-remove from the free list
+        index, last = self.free_index[cell], self.free_cells[-1]
+        self.free_cells[index] = last
+        self.free_index[last] = index
+        self.free_cells.pop()
+
+    def _vacate(self, pos):
+        cell = pos[1] * self.cols + pos[0]
+        self.occupied[cell] = 0
+        self.free_index[cell] = len(self.free_cells)
+        self.free_cells.append(cell)
+
+    def is_free(self, x, y):
+        return 0 <= x < self.cols and 0 <= y < self.rows and not self.occupied[y * self.cols + x]
 
     def spawn_food(self):
-        while True:
-            self.food = (random.randint(0, COLS-1), random.randint(0, ROWS-1))
-            if self.food not in self.snake:
-                break
+        if not self.free_cells:
+            self.food = None  # The snake fills the board
+            return
+        cell = self.free_cells[self.rng.randrange(len(self.free_cells))]
+        self.food = (cell % self.cols, cell // self.cols)
 
     def draw(self):
+        import pygame  # Only the window needs it, so the game logic runs where pygame isn't installed
+
         WIN.fill(BLACK)
         # Draw snake
         for segment in self.snake:
             pygame.draw.rect(WIN, GREEN, (segment[0]*CELL_SIZE, segment[1]*CELL_SIZE, CELL_SIZE, CELL_SIZE))
         # Draw food
-        pygame.draw.rect(WIN, RED, (self.food[0]*CELL_SIZE, self.food[1]*CELL_SIZE, CELL_SIZE, CELL_SIZE))
+        if self.food:
+            pygame.draw.rect(WIN, RED, (self.food[0]*CELL_SIZE, self.food[1]*CELL_SIZE, CELL_SIZE, CELL_SIZE))
         pygame.display.update()
 
+    def _next_search(self):
+        self.search_id += 1
+        if self.search_id > 0xFFFFFFFF:
+            self.visited = array('I', bytes(4 * self.cols * self.rows))
+            self.search_id = 1
+        return self.search_id
+
     def bfs_path(self, start, goal):
         """Breadth-First Search to find shortest path to goal."""
-        queue = deque([start])
-        came_from = {start: None}
+        if goal is None:
+            return None
+        cols, rows = self.cols, self.rows
+        occupied, came_from, queue = self.occupied, self.came_from, self.bfs_queue
+        search_id = self._next_search()
+        visited = self.visited
 
-        while queue:
-            current = queue.popleft()
-            if current == goal:
+        start_cell = start[1] * cols + start[0]
+        goal_cell = goal[1] * cols + goal[0]
+        visited[start_cell] = search_id
+        came_from[start_cell] = -1
+        queue[0] = start_cell
+        head, tail = 0, 1
+
+        while head < tail:
+            current = queue[head]
+            head += 1
+            if current == goal_cell:
                 break
 
-            for dx, dy in [(1,0), (-1,0), (0,1), (0,-1)]:
-                nx, ny = current[0] + dx, current[1] + dy
-                if 0 <= nx < COLS and 0 <= ny < ROWS and (nx, ny) not in self.snake and (nx, ny) not in came_from:
-                    came_from[(nx, ny)] = current
-                    queue.append((nx, ny))
+            y, x = divmod(current, cols)
+            # Same neighbour order as before: right, left, down, up
+            for neighbor, inside in ((current + 1, x < cols - 1), (current - 1, x > 0),
+                                     (current + cols, y < rows - 1), (current - cols, y > 0)):
+                if inside and not occupied[neighbor] and visited[neighbor] != search_id:
+                    visited[neighbor] = search_id
+                    came_from[neighbor] = current
+                    queue[tail] = neighbor
+                    tail += 1
 
         # Reconstruct path
-        if goal not in came_from:
+        if visited[goal_cell] != search_id:
             return None
         path = []
-        node = goal
-        while node != start:
-            path.append(node)
+        node = goal_cell
+        while node != start_cell:
+            path.append((node % cols, node // cols))
             node = came_from[node]
         path.reverse()
         return path
 
+    def tail_distance(self, occupied, head, tail):
+        """
+        Moves from head to tail over the free cells of occupied (a bytearray
+        like self.occupied), or -1 if the tail can't be reached. The tail's
+        cell is never free, so it only counts when entered from a cell other
+        than the head; by then the tail has moved on.
+        """
+        if head == tail:
+            return 0
+        cols, rows = self.cols, self.rows
+        dist, queue = self.bfs_dist, self.bfs_queue
+        search_id = self._next_search()
+        visited = self.visited
+        visited[head] = search_id
+        dist[head] = 0
+        queue[0] = head
+        front, back = 0, 1
+        while front < back:
+            current = queue[front]
+            front += 1
+            y, x = divmod(current, cols)
+            for neighbor, inside in ((current + 1, x < cols - 1), (current - 1, x > 0),
+                                     (current + cols, y < rows - 1), (current - cols, y > 0)):
+                if not inside:
+                    continue
+                if neighbor == tail and current != head:
+                    return dist[current] + 1
+                if not occupied[neighbor] and visited[neighbor] != search_id:
+                    visited[neighbor] = search_id
+                    dist[neighbor] = dist[current] + 1
+                    queue[back] = neighbor
+                    back += 1
+        return -1
+
+    def _safe_after(self, path):
+        """Walk path on a virtual copy of the body and check the tail can still be reached."""
+        cols = self.cols
+        # New body after eating, head first: the path reversed, then the old body, one longer
+        body = [y * cols + x for x, y in reversed(path)]
+        body += [y * cols + x for x, y in self.snake]
+        del body[len(self.snake) + 1:]
+        occupied = bytearray(len(self.occupied))
+        for cell in body:
+            occupied[cell] = 1
+        return self.tail_distance(occupied, body[0], body[-1]) >= 0
+
+    def _stall_direction(self):
+        """
+        No safe food path: pick a move after which the tail is still reachable.
+        Prefer the next cell on the Hamiltonian cycle, which packs the body
+        tightly, and otherwise the move that keeps the tail furthest away.
+        Returns None when every move looks fatal.
+        """
+        cols = self.cols
+        head_x, head_y = self.snake[0]
+        head = head_y * cols + head_x
+        tail_x, tail_y = self.snake[-1]
+        tail = tail_y * cols + tail_x
+        best, best_dist = None, -1
+        for dx, dy in [(1,0), (-1,0), (0,1), (0,-1)]:
+            nx, ny = head_x + dx, head_y + dy
+            if not self.is_free(nx, ny):
+                continue
+            move = ny * cols + nx
+            occupied = bytearray(self.occupied)
+            occupied[move] = 1
+            if (nx, ny) == self.food:
+                new_tail = tail
+            else:
+                occupied[tail] = 0
+                new_tail = self.snake[-2][1] * cols + self.snake[-2][0] if len(self.snake) > 1 else move
+            dist = self.tail_distance(occupied, move, new_tail)
+            if dist < 0:
+                continue
+            if self.cycle_next is not None and self.cycle_next[head] == move:
+                return dx, dy
+            if dist > best_dist:
+                best, best_dist = (dx, dy), dist
+        return best
+
     def ai_decision(self):
         """AI chooses next move based on BFS path to food."""
-        path = self.bfs_path(self.snake[0], self.food)
-        if path:
-            next_cell = path[0]
-            self.direction = (next_cell[0] - self.snake[0][0], next_cell[1] - self.snake[0][1])
+        head = self.snake[0]
+        # While we follow the cached path its cells stay free: the body only grows into
+        # cells we already walked and the tail only frees more. Replan when the food moves
+        # (it was eaten) or the snake left the route.
+        if self.reuse_path and self.path and self.path_head == head and self.path[0] == self.food:
+            self.reused_steps += 1
         else:
-            # No safe path — move randomly to survive
-            for dx, dy in [(1,0), (-1,0), (0,1), (0,-1)]:
-                nx, ny = self.snake[0][0] + dx, self.snake[0][1] + dy
-                if 0 <= nx < COLS and 0 <= ny < ROWS and (nx, ny) not in self.snake:
-                    self.direction = (dx, dy)
-                    break
+            self.replans += 1
+            path = self.bfs_path(head, self.food)
+            if path and self.planner == SURVIVAL and not self._safe_after(path):
+                path = None
+            self.path = path[::-1] if path else []
+        if self.path:
+            next_cell = self.path.pop()
+            self.path_head = next_cell
+            self.direction = (next_cell[0] - head[0], next_cell[1] - head[1])
+            return
+        stall = self._stall_direction() if self.planner == SURVIVAL else None
+        if stall is not None:
+            self.direction = stall
+            return
+        # No safe path — move randomly to survive
+        for dx, dy in [(1,0), (-1,0), (0,1), (0,-1)]:
+            nx, ny = self.snake[0][0] + dx, self.snake[0][1] + dy
+            if self.is_free(nx, ny):
+                self.direction = (dx, dy)
+                break
 
     def step(self):
         head_x, head_y = self.snake[0]
@@ -89,21 +298,50 @@ class SnakeGameAI:
         new_head = (head_x + dx, head_y + dy)
 
         # Check collision
-        if (new_head in self.snake) or not (0 <= new_head[0] < COLS and 0 <= new_head[1] < ROWS):
+        if not self.is_free(*new_head):
             return False  # Game over
 
         self.snake.appendleft(new_head)
+        self._occupy(new_head)
 
         # Check food
         if new_head == self.food:
             self.score += 1
             self.spawn_food()
         else:
-            self.snake.pop()
+            self._vacate(self.snake.pop())
 
         return True
 
+def play(game, stall_limit, max_steps):
+    """Run one game to the end; returns (score, decisions, seconds spent deciding, outcome)."""
+    decisions = 0
+    thinking = 0.0
+    since_food = 0
+    while decisions < max_steps:
+        start = time.perf_counter()
+        game.ai_decision()
+        thinking += time.perf_counter() - start
+        decisions += 1
+        score = game.score
+        if not game.step():
+            return score, decisions, thinking, "crashed"
+        if game.food is None:
+            return game.score, decisions, thinking, "filled board"
+        since_food = 0 if game.score != score else since_food + 1
+        if since_food > stall_limit:
+            return game.score, decisions, thinking, "stalled"
+    return game.score, decisions, thinking, "step limit"
+
+
 def main():
+    global WIN
+    import pygame
+
+    pygame.init()
+    WIN = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Snake Game AI")
+
     clock = pygame.time.Clock()
     game = SnakeGameAI()
     run = True
@@ -116,7 +354,7 @@ def main():
 
         game.ai_decision()
         if not game.step():
-            print(f"Game over! Score: {game.score}")
+            print(f"Game over! Score: {game.score} ({game.replans} replans, {game.reused_steps} reused steps)")
             game.reset()
 
         game.draw()
@@ -0,0 +1,206 @@
+import random
+
+import numpy as np
+
+from air_hockey_physics import HEIGHT, MAX_BOUNCES, PADDLE_RADIUS, PADDLE_SPEED, PUCK_RADIUS, PUCK_SPEED, WIDTH
+
+PLAYER_X = 50
+AI_X = WIDTH - 50
+
+
+class AirHockeyBatch:
+    """
+    N independent air-hockey matches stepped in lockstep on NumPy arrays, no window.
+
+    State is kept as one array per quantity (puck_x, puck_vy, ai_y, ...) with
+    a slot per match, and every call to step advances all matches by one
+    fixed timestep of dt frames, speeds being in pixels per 60 FPS frame like
+    air_hockey_physics. With dt=1 match i replays air_hockey_physics with
+    Puck(..., random.Random(seeds[i])) frame for frame: the collision tests
+    are the same, just written over whole arrays, and each match draws its
+    serves from its own RNG in the same order.
+
+    swept=True resolves contacts by time of impact instead, matching
+    Puck.move_swept, so large timesteps neither tunnel nor drift: with
+    the paddles still, one step of dt=10 lands where ten steps of dt=1 would.
+
+    Drawing is up to the caller; nothing here depends on pygame.
+    """
+
+    def __init__(self, num_matches, seeds=None, dt=1.0, swept=False):
+        if seeds is None:
+            seeds = [random.randrange(2 ** 63) for _ in range(num_matches)]
+        self.num_matches = num_matches
+        self.dt = dt
+        self.swept = swept
+        self.rngs = [random.Random(seed) for seed in seeds]
+
+        self.puck_x = np.zeros(num_matches)
+        self.puck_y = np.zeros(num_matches)
+        self.puck_vx = np.zeros(num_matches)
+        self.puck_vy = np.zeros(num_matches)
+        self.player_y = np.full(num_matches, float(HEIGHT // 2))
+        self.ai_y = np.full(num_matches, float(HEIGHT // 2))
+        self.player_goals = np.zeros(num_matches, dtype=np.int64)
+        self.ai_goals = np.zeros(num_matches, dtype=np.int64)
+        self.frames = 0  # Game time so far, dt frames per step
+        for match in range(num_matches):
+            self._serve(match)
+
+    def _serve(self, match):
+        # Same random calls as Puck.__init__
+        rng = self.rngs[match]
+        self.puck_x[match] = WIDTH // 2
+        self.puck_y[match] = HEIGHT // 2
+        self.puck_vx[match] = rng.choice([-PUCK_SPEED, PUCK_SPEED])
+        self.puck_vy[match] = rng.choice([-PUCK_SPEED, PUCK_SPEED])
+
+    def tracking_moves(self, paddle_x, paddle_y):
+        """Paddle.ai_move for every match: the dy each paddle at paddle_x would take."""
+        toward_us = self.puck_vx < 0 if paddle_x < WIDTH / 2 else self.puck_vx > 0
+        target_y = np.where(toward_us, self.puck_y, HEIGHT // 2)
+        return np.sign(target_y - paddle_y) * PADDLE_SPEED
+
+    @staticmethod
+    def _circle_hit_times(x, y, vx, vy, cx, cy, reach):
+        """air_hockey_physics.circle_hit_time over arrays, inf where there is no hit."""
+        dx, dy = x - cx, y - cy
+        approach = dx * vx + dy * vy
+        gap = dx * dx + dy * dy - reach * reach
+        speed2 = np.maximum(vx * vx + vy * vy, 1e-12)
+        disc = approach * approach - speed2 * gap
+        with np.errstate(invalid="ignore"):
+            t = (-approach - np.sqrt(disc)) / speed2
+        t = np.where(gap <= 0, 0.0, t)
+        return np.where((approach < 0) & (disc >= 0), t, np.inf)
+
+    def _sweep_puck(self):
+        """Puck.move_swept for every match, one time-of-impact pass per bounce."""
+        x, y, vx, vy = self.puck_x, self.puck_y, self.puck_vx.copy(), self.puck_vy.copy()
+        remaining = np.full(self.num_matches, float(self.dt))
+        active = np.ones(self.num_matches, dtype=bool)
+        reach = PUCK_RADIUS + PADDLE_RADIUS
+        for _ in range(MAX_BOUNCES):
+            with np.errstate(divide="ignore"):
+                wall_top = np.where(vy < 0, np.maximum(0.0, (y - PUCK_RADIUS) / -vy), np.inf)
+                wall_bottom = np.where(vy > 0, np.maximum(0.0, (HEIGHT - PUCK_RADIUS - y) / vy), np.inf)
+            hit_player = self._circle_hit_times(x, y, vx, vy, PLAYER_X, self.player_y, reach)
+            hit_ai = self._circle_hit_times(x, y, vx, vy, AI_X, self.ai_y, reach)
+            times = np.stack([wall_top, wall_bottom, hit_player, hit_ai])
+            event = times.argmin(axis=0)
+            hit_time = times[event, np.arange(self.num_matches)]
+            hit = active & (hit_time < remaining)
+            travel = np.where(active, np.where(hit, hit_time, remaining), 0.0)
+            x, y = x + vx * travel, y + vy * travel
+            remaining -= travel
+
+            # Contact normals: straight off the walls, from the paddle's centre for paddles
+            center_x = np.where(event == 2, PLAYER_X, AI_X)
+            center_y = np.where(event == 2, self.player_y, self.ai_y)
+            off_x, off_y = x - center_x, y - center_y
+            distance = np.hypot(off_x, off_y)
+            distance[distance == 0] = 1.0
+            normal_x = np.where(event < 2, 0.0, off_x / distance)
+            normal_y = np.where(event == 0, 1.0, np.where(event == 1, -1.0, off_y / distance))
+            along = np.where(hit, vx * normal_x + vy * normal_y, 0.0)
+            vx, vy = vx - 2 * along * normal_x, vy - 2 * along * normal_y
+            active = hit
+            if not active.any():
+                break
+        self.puck_x, self.puck_y, self.puck_vx, self.puck_vy = x, y, vx, vy
+
+    def step(self, player_dy=None, ai_dy=None):
+        """
+        Advance every match by one timestep. player_dy / ai_dy: optional
+        arrays of paddle moves in pixels per frame, clipped to PADDLE_SPEED;
+        by default each paddle runs the tracking AI.
+        Returns (ai_scored, player_scored) boolean arrays for this step.
+        """
+        dt = self.dt
+        if player_dy is None:
+            player_dy = self.tracking_moves(PLAYER_X, self.player_y)
+        if ai_dy is None:
+            ai_dy = self.tracking_moves(AI_X, self.ai_y)
+        # Both paddles decide from the same puck state, then move
+        self.player_y = np.clip(self.player_y + dt * np.clip(player_dy, -PADDLE_SPEED, PADDLE_SPEED),
+                                PADDLE_RADIUS, HEIGHT - PADDLE_RADIUS)
+        self.ai_y = np.clip(self.ai_y + dt * np.clip(ai_dy, -PADDLE_SPEED, PADDLE_SPEED),
+                            PADDLE_RADIUS, HEIGHT - PADDLE_RADIUS)
+
+        if self.swept:
+            self._sweep_puck()
+        else:
+            x = self.puck_x = self.puck_x + dt * self.puck_vx
+            y = self.puck_y = self.puck_y + dt * self.puck_vy
+
+            # Bounce off top/bottom
+            wall = (y - PUCK_RADIUS <= 0) | (y + PUCK_RADIUS >= HEIGHT)
+            self.puck_vy = np.where(wall, -self.puck_vy, self.puck_vy)
+
+            # Bounce off paddles
+            hit_player = ((x - PUCK_RADIUS <= PLAYER_X + PADDLE_RADIUS)
+                          & (np.abs(y - self.player_y) <= PADDLE_RADIUS) & (self.puck_vx < 0))
+            vx = np.where(hit_player, -self.puck_vx, self.puck_vx)
+            hit_ai = (x + PUCK_RADIUS >= AI_X - PADDLE_RADIUS) & (np.abs(y - self.ai_y) <= PADDLE_RADIUS) & (vx > 0)
+            self.puck_vx = np.where(hit_ai, -vx, vx)
+
+        # Goals: serve again from the middle
+        ai_scored = self.puck_x < 0
+        player_scored = self.puck_x > WIDTH
+        self.ai_goals += ai_scored
+        self.player_goals += player_scored
+        for match in np.flatnonzero(ai_scored | player_scored):
+            self._serve(match)
+        self.frames += self.dt
+        return ai_scored, player_scored
+
+
+if __name__ == "__main__":
+    import time
+
+    from air_hockey_physics import AI_GOAL, Paddle, Puck
+
+    # The batch must replay the scalar physics exactly, with a random opponent on the left
+    seeds = list(range(16))
+    batch = AirHockeyBatch(len(seeds), seeds)
+    matches = [(Paddle(PLAYER_X, HEIGHT // 2), Paddle(AI_X, HEIGHT // 2), Puck(WIDTH // 2, HEIGHT // 2,
+                random.Random(seed))) for seed in seeds]
+    goals = [[0, 0] for _ in seeds]
+    moves = np.random.default_rng(0).choice([-PADDLE_SPEED, 0, PADDLE_SPEED], size=(5000, len(seeds)))
+    for frame_moves in moves:
+        batch.step(player_dy=frame_moves)
+        for match, (player, ai, puck) in enumerate(matches):
+            player.move(int(frame_moves[match]))
+            ai.ai_move(puck)
+            scorer = puck.move(player, ai)
+            if scorer is not None:
+                goals[match][scorer != AI_GOAL] += 1
+    assert goals == np.stack([batch.ai_goals, batch.player_goals], axis=1).tolist()
+    print(f"Batch matches the scalar physics over 5000 frames ({batch.ai_goals.sum()} AI goals)")
+
+    for num_matches in (1000, 10000):
+        batch = AirHockeyBatch(num_matches, range(num_matches))
+        start = time.perf_counter()
+        for _ in range(600):
+            batch.step()
+        elapsed = time.perf_counter() - start
+        frames_per_second = 600 * num_matches / elapsed
+        print(f"{num_matches} matches: {frames_per_second:,.0f} match-frames/s, "
+              f"{frames_per_second / 60:,.0f}x real time at 60 FPS")
+
+    # Coarse steps: the same ten seconds at 1 and at 10 frames per step, idle paddles,
+    # comparing puck positions every 10 frames until a match's first goal
+    for swept in (False, True):
+        fine = AirHockeyBatch(1000, range(1000), dt=1, swept=swept)
+        coarse = AirHockeyBatch(1000, range(1000), dt=10, swept=swept)
+        idle = np.zeros(1000)
+        drift = np.zeros(1000)
+        scored = np.zeros(1000, dtype=bool)
+        for _ in range(60):
+            for _ in range(10):
+                scored |= np.logical_or(*fine.step(idle, idle))
+            scored |= np.logical_or(*coarse.step(idle, idle))
+            error = np.hypot(fine.puck_x - coarse.puck_x, fine.puck_y - coarse.puck_y)
+            drift = np.where(scored, drift, np.maximum(drift, error))
+        assert fine.frames == coarse.frames == 600
+        print(f"{'swept' if swept else 'discrete'}: dt=10 vs dt=1, max puck drift {drift.max():.2g} px")
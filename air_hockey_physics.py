@@ -0,0 +1,188 @@
+import math
+import random
+
+# Rink dimensions
+WIDTH, HEIGHT = 800, 400
+
+# Game objects
+PADDLE_RADIUS = 20
+PUCK_RADIUS = 15
+PADDLE_SPEED = 6
+PUCK_SPEED = 5
+
+# Puck.move results
+PLAYER_GOAL = "player"
+AI_GOAL = "ai"
+
+# Most contacts resolved within one swept step before the rest of the step is dropped
+MAX_BOUNCES = 8
+
+
+def circle_hit_time(x, y, vx, vy, cx, cy, reach):
+    """
+    Earliest t >= 0 at which a point at (x, y) moving at (vx, vy) comes within
+    reach of (cx, cy) while approaching it, or None. A point already inside
+    and still approaching hits at t = 0.
+    """
+    dx, dy = x - cx, y - cy
+    approach = dx * vx + dy * vy
+    if approach >= 0:
+        return None
+    gap = dx * dx + dy * dy - reach * reach
+    if gap <= 0:
+        return 0.0
+    speed2 = vx * vx + vy * vy
+    disc = approach * approach - speed2 * gap
+    if disc < 0:
+        return None
+    return (-approach - math.sqrt(disc)) / speed2
+
+
+class Paddle:
+    def __init__(self, x, y, color=None, is_ai=False, predictive=False):
+        self.x = x
+        self.y = y
+        self.color = color
+        self.is_ai = is_ai
+        # Aim for where the puck will arrive instead of where it is
+        self.predictive = predictive
+        self.prediction = None  # (vx, vy, x, y, intercept) of the puck line last solved
+
+    def move(self, dy):
+        self.y += dy
+        self.y = max(PADDLE_RADIUS, min(HEIGHT - PADDLE_RADIUS, self.y))
+
+    def predict_intercept(self, puck):
+        """
+        Height at which the puck will reach this paddle, or None if it is
+        moving away. Solved in closed form: the wall bounces are unfolded into
+        one straight line, whose end is folded back into the rink, so the
+        cost is the same for any number of bounces. The answer is reused
+        while the puck stays on the same line (same velocity, and no bounce
+        or serve has moved it off).
+        """
+        vx, vy = puck.vx, puck.vy
+        cached = self.prediction
+        if (cached is not None and cached[0] == vx and cached[1] == vy
+                and abs(puck.y - cached[3] - vy * (puck.x - cached[2]) / vx) < 1e-6):
+            return cached[4]
+
+        left_side = self.x < WIDTH / 2
+        if vx == 0 or (vx > 0) == left_side:
+            intercept = None
+        else:
+            contact_x = self.x + PADDLE_RADIUS + PUCK_RADIUS if left_side else self.x - PADDLE_RADIUS - PUCK_RADIUS
+            frames = max(0.0, (contact_x - puck.x) / vx)
+            # Fold the unfolded height back between the walls
+            low, span = PUCK_RADIUS, HEIGHT - 2 * PUCK_RADIUS
+            offset = (puck.y + vy * frames - low) % (2 * span)
+            intercept = low + (offset if offset <= span else 2 * span - offset)
+        if vx != 0:
+            self.prediction = (vx, vy, puck.x, puck.y, intercept)
+        return intercept
+
+    def ai_move(self, puck):
+        """
+        Simple AI: moves toward the puck's Y position, 
+        and predicts where the puck will be if coming towards it.
+
+        Predictive paddles head for predict_intercept instead and step exactly
+        onto their target, so they don't jitter around it.
+        """
+        if self.predictive:
+            target_y = self.predict_intercept(puck)
+            if target_y is None:
+                target_y = HEIGHT // 2
+            self.move(max(-PADDLE_SPEED, min(PADDLE_SPEED, target_y - self.y)))
+            return
+
+        # Only track puck if it's heading for our side (the right one unless we are on the left)
+        toward_us = puck.vx < 0 if self.x < WIDTH / 2 else puck.vx > 0
+        if toward_us:
+            target_y = puck.y
+        else:
+            target_y = HEIGHT // 2
+
+        if self.y < target_y:
+            self.move(PADDLE_SPEED)
+        elif self.y > target_y:
+            self.move(-PADDLE_SPEED)
+
+
+class Puck:
+    def __init__(self, x, y, rng=random):
+        # rng: anything with choice(), e.g. random.Random(seed) to replay a match
+        self.rng = rng
+        self.x = x
+        self.y = y
+        self.vx = rng.choice([-PUCK_SPEED, PUCK_SPEED])
+        self.vy = rng.choice([-PUCK_SPEED, PUCK_SPEED])
+
+    def move(self, player, ai):
+        """Advance one frame against the two paddles; returns PLAYER_GOAL, AI_GOAL or None."""
+        self.x += self.vx
+        self.y += self.vy
+
+        # Bounce off top/bottom
+        if self.y - PUCK_RADIUS <= 0 or self.y + PUCK_RADIUS >= HEIGHT:
+            self.vy *= -1
+
+        # Bounce off paddles
+        if (self.x - PUCK_RADIUS <= player.x + PADDLE_RADIUS and 
+            abs(self.y - player.y) <= PADDLE_RADIUS) and self.vx < 0:
+            self.vx *= -1
+        if (self.x + PUCK_RADIUS >= ai.x - PADDLE_RADIUS and 
+            abs(self.y - ai.y) <= PADDLE_RADIUS) and self.vx > 0:
+            self.vx *= -1
+
+        return self._check_goal()
+
+    def move_swept(self, player, ai, dt=1.0):
+        """
+        Advance dt frames with continuous collision detection instead of
+        move's end-of-frame overlap tests, so trajectories differ from move
+        exactly where move goes wrong: a fast puck that would pass through a
+        paddle or wall between two frames hits it here.
+
+        The puck travels in straight lines between contacts: each pass finds
+        the earliest time of impact within the rest of dt with a wall or a
+        paddle (circle against circle, paddles held where they are for the
+        step), moves there, reflects the velocity about the contact normal
+        and carries on. At most MAX_BOUNCES contacts are resolved per call;
+        any of the step left after that is dropped.
+        While the paddles stay put, one step of dt frames lands where dt
+        steps of one frame of move_swept would.
+        """
+        remaining = float(dt)
+        reach = PUCK_RADIUS + PADDLE_RADIUS
+        for _ in range(MAX_BOUNCES):
+            vx, vy = self.vx, self.vy
+            hit_time, normal = remaining, None
+            if vy < 0 and (self.y - PUCK_RADIUS) / -vy < hit_time:
+                hit_time, normal = max(0.0, (self.y - PUCK_RADIUS) / -vy), (0.0, 1.0)
+            elif vy > 0 and (HEIGHT - PUCK_RADIUS - self.y) / vy < hit_time:
+                hit_time, normal = max(0.0, (HEIGHT - PUCK_RADIUS - self.y) / vy), (0.0, -1.0)
+            for paddle in (player, ai):
+                t = circle_hit_time(self.x, self.y, vx, vy, paddle.x, paddle.y, reach)
+                if t is not None and t < hit_time:
+                    hit_time, normal = t, paddle
+
+            self.x += vx * hit_time
+            self.y += vy * hit_time
+            remaining -= hit_time
+            if normal is None:
+                break
+            if isinstance(normal, Paddle):
+                distance = math.hypot(self.x - normal.x, self.y - normal.y) or 1.0
+                normal = ((self.x - normal.x) / distance, (self.y - normal.y) / distance)
+            along = vx * normal[0] + vy * normal[1]
+            self.vx, self.vy = vx - 2 * along * normal[0], vy - 2 * along * normal[1]
+        return self._check_goal()
+
+    def _check_goal(self):
+        # Reset if goal scored
+        if self.x < 0 or self.x > WIDTH:
+            scorer = AI_GOAL if self.x < 0 else PLAYER_GOAL
+            Puck.__init__(self, WIDTH // 2, HEIGHT // 2, self.rng)
+            return scorer
+        return None
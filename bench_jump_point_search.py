@@ -0,0 +1,99 @@
+"""
+Node expansions and query time of A* vs Jump Point Search on open and maze-like maps.
+
+    python bench_jump_point_search.py --size 512 --queries 20
+
+Both are reported, with JPS relative to A* on the same queries, because
+they disagree: JPS always expands far fewer cells, but each of its jumps
+scans cells one at a time in Python. On open maps A* with its tie-breaking
+already expands little more than the path itself, so the scans make JPS
+several times slower in wall time there; on mazes, where A* expands far
+more, the two are roughly level (256x256: 0.3x the expansions, 0.7-1.1x
+the time from run to run).
+"""
+import argparse
+import random
+import time
+
+from grid_astar import GridAStar
+from jump_point_search import JumpPointSearch
+
+
+def open_map(size, rng, obstacles=None):
+    """Open terrain with a scattering of rectangular rocks/buildings."""
+    blocked = bytearray(size * size)
+    for _ in range(obstacles or size // 8):
+        height, width = rng.randint(2, size // 10 + 2), rng.randint(2, size // 10 + 2)
+        top, left = rng.randrange(size - height), rng.randrange(size - width)
+        for row in range(top, top + height):
+            blocked[row * size + left:row * size + left + width] = b'\x01' * width
+    return blocked
+
+
+def maze_map(size, rng):
+    """Recursive-backtracker maze: corridors on odd cells, walls everywhere else."""
+    blocked = bytearray(b'\x01' * (size * size))
+    start = (1, 1)
+    blocked[size + 1] = 0
+    stack = [start]
+    while stack:
+        row, col = stack[-1]
+        options = [(row + d_row, col + d_col, d_row, d_col) for d_row, d_col in ((2, 0), (-2, 0), (0, 2), (0, -2))
+                   if 0 < row + d_row < size - 1 and 0 < col + d_col < size - 1
+                   and blocked[(row + d_row) * size + col + d_col]]
+        if not options:
+            stack.pop()
+            continue
+        n_row, n_col, d_row, d_col = rng.choice(options)
+        blocked[(row + d_row // 2) * size + col + d_col // 2] = 0
+        blocked[n_row * size + n_col] = 0
+        stack.append((n_row, n_col))
+    return blocked
+
+
+def free_cells(blocked, size, rng, count):
+    cells = []
+    while len(cells) < count:
+        row, col = rng.randrange(size), rng.randrange(size)
+        if not blocked[row * size + col]:
+            cells.append((row, col))
+    return cells
+
+
+def run(label, engine, pairs, baseline=None):
+    """Time the queries and print them, against baseline's (seconds, expansions) when given; returns ours."""
+    expanded = 0
+    found = 0
+    start = time.perf_counter()
+    for src, dst in pairs:
+        if engine.find_path(src, dst) is not None:
+            found += 1
+        expanded += engine.expanded
+    elapsed = time.perf_counter() - start
+    relative = ""
+    if baseline is not None:
+        relative = f"   vs A*: {elapsed / baseline[0]:.2f}x time, {expanded / max(baseline[1], 1):.3f}x expansions"
+    print(f"  {label:<18}{1000 * elapsed / len(pairs):>10.2f} ms/query{expanded / len(pairs):>14.0f} expansions"
+          f"  ({found}/{len(pairs)} found){relative}")
+    return elapsed, expanded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for name, blocked in (("open", open_map(args.size, rng)), ("maze", maze_map(args.size, rng))):
+        cells = free_cells(blocked, args.size, rng, 2 * args.queries)
+        pairs = list(zip(cells[::2], cells[1::2]))
+        print(f"{name} map {args.size}x{args.size}:")
+        baseline = run("A* (4-conn)", GridAStar(args.size, args.size, blocked), pairs)
+        run("JPS (4-conn)", JumpPointSearch(args.size, args.size, blocked), pairs, baseline)
+        run("JPS (8-conn)", JumpPointSearch(args.size, args.size, blocked, diagonal=True), pairs, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Query latency and preprocessing cost of the WeightedGraph shortest-path modes
+on a random road-like grid network.
+
+    python bench_landmarks.py --side 150 --queries 200 --landmarks 8
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from dijkstra_Weighted_Graph import WeightedGraph, road_network
+from landmark_index import LandmarkIndex
+
+
+def time_queries(label, pairs, query):
+    start = time.perf_counter()
+    for src, dst in pairs:
+        query(src, dst)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34}{1000 * elapsed / len(pairs):>12.3f} ms/query")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--side", type=int, default=100, help="grid side, the graph has side^2 nodes")
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--landmarks", type=int, default=8)
+    parser.add_argument("--matrix-limit", type=int, default=2500,
+                        help="skip the O(V^2) matrix mode above this many nodes")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    node_count = args.side * args.side
+    graph = road_network(args.side, "csr", args.seed)
+    rng = random.Random(args.seed)
+    pairs = [(str(rng.randrange(node_count)), str(rng.randrange(node_count))) for _ in range(args.queries)]
+    print(f"{node_count} nodes, {len(graph.to_csr()[1]) // 2} roads, {args.queries} random queries\n")
+
+    start = time.perf_counter()
+    index = LandmarkIndex.build(graph, args.landmarks)
+    build_time = time.perf_counter() - start
+    with tempfile.TemporaryDirectory() as directory:
+        index_path = os.path.join(directory, "bench.alt")
+        index.save(index_path)
+        start = time.perf_counter()
+        index = LandmarkIndex.load(index_path)
+        load_time = time.perf_counter() - start
+        print(f"ALT preprocessing: {build_time:.2f} s for {args.landmarks} landmarks, "
+              f"{os.path.getsize(index_path) / 2 ** 20:.1f} MiB on disk, mmap load {1000 * load_time:.2f} ms\n")
+
+        if node_count <= args.matrix_limit:
+            dense = road_network(args.side, "matrix", args.seed)
+            time_queries("matrix O(V^2) full sweep", pairs, lambda s, d: dense.compute_shortest_paths(s))
+        else:
+            print(f"{'matrix O(V^2) full sweep':<34}{'skipped':>12}")
+        time_queries("csr heap full sweep", pairs, lambda s, d: graph.compute_shortest_paths(s))
+        time_queries("early exit", pairs, lambda s, d: graph.shortest_path(s, d))
+        time_queries("bidirectional", pairs, lambda s, d: graph.shortest_path(s, d, bidirectional=True))
+        time_queries("ALT landmarks", pairs, lambda s, d: index.shortest_path(graph, s, d))
+
+        # Sanity check: every mode must agree on the costs
+        for src, dst in pairs[:20]:
+            assert index.shortest_path(graph, src, dst)[0] == graph.shortest_path(src, dst)[0]
+        index.close()
+
+
+if __name__ == "__main__":
+    main()
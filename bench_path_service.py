@@ -0,0 +1,228 @@
+"""
+Load generator for path_service.py: latency percentiles and throughput under a mixed query load.
+
+    python bench_path_service.py --connections 16 --requests 5000 --workers 4
+    python bench_path_service.py --port 8765 --grid-size 256   # against a running service
+    python bench_path_service.py --check   # correctness checks of the service core, no load
+
+Without --port or --unix it starts the service in this process, once with
+coalescing and batching off and once with them on, and reports both. The
+queries come from small hot sets (--hot of each kind), so identical queries
+and distance queries sharing a source overlap in time the way they do
+behind a game server.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from brute_force import find_winner, open_positions
+from dijkstra_Weighted_Graph import road_network
+from path_service import PathService, _grid_path, _parse, _start_worker, grid_layout, serve
+
+
+def hot_queries(rng, hot, layout, graph_nodes):
+    """hot queries of each kind, as request dicts without ids."""
+    open_cells = [[row, col] for row, cells in enumerate(layout) for col, cell in enumerate(cells) if cell != "#"]
+    queries = [{"op": "grid_path", "start": rng.choice(open_cells), "goal": rng.choice(open_cells)}
+               for _ in range(hot)]
+
+    sources = rng.sample(range(graph_nodes), max(1, hot // 8))
+    queries += [{"op": "distances", "source": str(rng.choice(sources)),
+                 "targets": [str(rng.randrange(graph_nodes)) for _ in range(4)]} for _ in range(hot)]
+
+    boards = []
+    while len(boards) < hot:
+        board = [" "] * 9
+        for turn in range(rng.randrange(1, 6)):
+            board[rng.choice(open_positions(board))] = "XO"[turn % 2]
+        if not find_winner(board):
+            boards.append({"op": "best_move", "board": "".join(board), "player": "XO"[(9 - board.count(" ")) % 2]})
+    return queries + boards
+
+
+async def run_client(connect, queries, count, pipeline, latencies, errors):
+    """Send count queries on one connection, keeping up to pipeline of them outstanding."""
+    reader, writer = await connect()
+    sent_at = {}
+    window = asyncio.Semaphore(pipeline)
+    ids = itertools.count()
+
+    async def send():
+        for query in queries[:count]:
+            await window.acquire()
+            request_id = next(ids)
+            sent_at[request_id] = (query["op"], time.perf_counter())
+            writer.write(json.dumps({"id": request_id, **query}).encode() + b"\n")
+            await writer.drain()
+
+    sender = asyncio.create_task(send())
+    for _ in range(count):
+        answer = json.loads(await reader.readline())
+        op, start = sent_at.pop(answer["id"])
+        latencies.setdefault(op, []).append(time.perf_counter() - start)
+        if "error" in answer:
+            errors.append(answer["error"])
+        window.release()
+    await sender
+    writer.close()
+    await writer.wait_closed()
+
+
+async def server_stats(connect):
+    reader, writer = await connect()
+    writer.write(b'{"id": 0, "op": "stats"}\n')
+    await writer.drain()
+    stats = json.loads(await reader.readline())["result"]
+    writer.close()
+    await writer.wait_closed()
+    return stats
+
+
+async def load_test(connect, args):
+    rng = random.Random(args.seed)
+    hot = hot_queries(rng, args.hot, grid_layout(args.grid, args.grid_size, args.grid_seed), args.graph_nodes)
+    per_client = args.requests // args.connections
+    latencies, errors = {}, []
+    start = time.perf_counter()
+    await asyncio.gather(*(run_client(connect, [rng.choice(hot) for _ in range(per_client)], per_client,
+                                      args.pipeline, latencies, errors)
+                           for _ in range(args.connections)))
+    elapsed = time.perf_counter() - start
+    return latencies, errors, elapsed, await server_stats(connect)
+
+
+def report(label, latencies, errors, elapsed, stats):
+    total = sum(len(values) for values in latencies.values())
+    print(f"{label}: {total} queries in {elapsed:.2f} s, {total / elapsed:,.0f} QPS, {len(errors)} errors")
+    for op, values in sorted(latencies.items()) + [("all", [v for values in latencies.values() for v in values])]:
+        cuts = statistics.quantiles(values, n=100)
+        print(f"  {op:<10}{len(values):>7} queries   p50 {1000 * cuts[49]:>8.2f} ms   p99 {1000 * cuts[98]:>8.2f} ms")
+    print(f"  server: {stats['jobs']} searches for {stats['queries']} queries, "
+          f"{stats['coalesced']} coalesced, {stats['batched']} batched by source")
+    if errors:
+        print(f"  first error: {errors[0]}")
+
+
+async def local_run(args, coalesce, batch_ms):
+    loop = asyncio.get_running_loop()
+    ready = loop.create_future()
+    server_task = asyncio.create_task(serve(port=0, workers=args.workers, grid_size=args.grid_size,
+                                            grid_seed=args.grid_seed, batch_ms=batch_ms, coalesce=coalesce,
+                                            ready=ready, grid_path=args.grid))
+    server = await ready
+    host, port = server.sockets[0].getsockname()[:2]
+    try:
+        return await load_test(lambda: asyncio.open_connection(host, port), args)
+    finally:
+        server_task.cancel()
+        await asyncio.gather(server_task, return_exceptions=True)
+
+
+async def check_cancelled_under_backpressure(pool):
+    # Not started, so nothing drains the one-slot job queue: the first query fills it
+    service = PathService(pool, workers=1, queue_size=1)
+    first = asyncio.create_task(service.query("best_move", (" " * 9, "X", 3, 3, 3)))
+    args = ("X" + " " * 8, "O", 3, 3, 3)
+    blocked = asyncio.create_task(service.query("best_move", args))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+    blocked.cancel()
+    await asyncio.gather(blocked, return_exceptions=True)
+    assert ("best_move", args) not in service.in_flight, "cancelled query left a future to coalesce onto"
+
+    service.start()
+    try:
+        again = await asyncio.wait_for(service.query("best_move", args), 10)
+        assert again["move"] is not None and (await first)["move"] is not None
+        assert service.stats["coalesced"] == 0
+    finally:
+        await service.stop()
+
+
+def check_solver_bounds():
+    for request in ({"rows": 7, "cols": 7, "k": 4}, {"rows": 4, "cols": 4, "k": 5}, {"rows": 3, "cols": 3, "k": 0},
+                    {"rows": "3", "cols": 3, "k": 3}):
+        try:
+            _parse({"op": "best_move", "board": " " * 9, "player": "X", **request})
+        except ValueError:
+            continue
+        raise AssertionError(f"best_move accepted {request}")
+    assert _parse({"op": "best_move", "board": " " * 16, "player": "X", "rows": 4, "cols": 4, "k": 4})
+
+
+async def check_batching_answers(pool):
+    """The same distance queries must get the same replies with batching on and off."""
+    queries = [("5", ("9", "77")), ("5", ("9", "nope")), ("nope", ("9",)), ("12", None)]
+    replies = []
+    for batch_ms in (0, 2.0):
+        service = PathService(pool, workers=1, batch_ms=batch_ms)
+        service.start()
+        try:
+            outcomes = await asyncio.gather(*(service.query("distances", args) for args in queries),
+                                            return_exceptions=True)
+        finally:
+            await service.stop()
+        replies.append([repr(outcome) if isinstance(outcome, Exception) else outcome for outcome in outcomes])
+    assert replies[0] == replies[1], replies
+    assert replies[0][1] == repr(ValueError("'nope' is not a node label"))
+
+
+def check_grid_file(directory, graph_path):
+    grid_path = os.path.join(directory, "level.txt")
+    with open(grid_path, "w") as file:
+        file.write(".#.\n.#.\n...\n")
+    _start_worker(256, 0, graph_path, grid_path)  # Run in this process, no pool needed
+    assert _grid_path((0, 0), (0, 2)) == [[0, 0], [1, 0], [2, 0], [2, 1], [2, 2], [1, 2], [0, 2]]
+
+
+async def run_checks():
+    check_solver_bounds()
+    with tempfile.TemporaryDirectory() as directory:
+        graph_path = os.path.join(directory, "roads.wgraph")
+        road_network(20, "csr", 0).save(graph_path)
+        check_grid_file(directory, graph_path)
+        with ProcessPoolExecutor(max_workers=1, initializer=_start_worker,
+                                 initargs=(32, 0, graph_path)) as pool:
+            await check_cancelled_under_backpressure(pool)
+            await check_batching_answers(pool)
+    print("Service checks passed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="load a running service instead of starting one")
+    parser.add_argument("--unix", help="load a running service on this Unix socket")
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--pipeline", type=int, default=8, help="queries outstanding per connection")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--hot", type=int, default=200, help="distinct queries of each kind")
+    parser.add_argument("--workers", type=int, default=None, help="local service: pool size, default one per CPU")
+    parser.add_argument("--grid", help="layout file, the same one the service was given")
+    parser.add_argument("--grid-size", type=int, default=256, help="without --grid: must match the service's")
+    parser.add_argument("--grid-seed", type=int, default=0, help="must match the service's")
+    parser.add_argument("--graph-nodes", type=int, default=100 * 100, help="nodes labelled 0..n-1 in the service's graph")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--check", action="store_true", help="run the service correctness checks instead")
+    args = parser.parse_args()
+
+    if args.check:
+        asyncio.run(run_checks())
+    elif args.unix:
+        report("service", *asyncio.run(load_test(lambda: asyncio.open_unix_connection(args.unix), args)))
+    elif args.port:
+        report("service", *asyncio.run(load_test(lambda: asyncio.open_connection(args.host, args.port), args)))
+    else:
+        report("plain", *asyncio.run(local_run(args, coalesce=False, batch_ms=0)))
+        report("coalescing + batching", *asyncio.run(local_run(args, coalesce=True, batch_ms=2.0)))
+
+
+if __name__ == "__main__":
+    main()
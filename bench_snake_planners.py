@@ -0,0 +1,39 @@
+"""
+Average score and decision time of the snake AI planners, headless.
+
+    python bench_snake_planners.py --size 50 --games 10 --max-steps 20000
+"""
+import argparse
+
+from ai_snake_game import BFS, SURVIVAL, SnakeGameAI, play
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=50)
+    parser.add_argument("--games", type=int, default=10)
+    parser.add_argument("--max-steps", type=int, default=20000, help="per game; a full 50x50 board takes millions")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    cells = args.size * args.size
+    print(f"{args.games} games on a {args.size}x{args.size} board:")
+    for planner in (BFS, SURVIVAL):
+        scores = []
+        decisions = 0
+        thinking = 0.0
+        outcomes = {}
+        for seed in range(args.seed, args.seed + args.games):
+            game = SnakeGameAI(seed, args.size, args.size, planner=planner)
+            score, game_decisions, game_thinking, outcome = play(game, stall_limit=2 * cells, max_steps=args.max_steps)
+            scores.append(score)
+            decisions += game_decisions
+            thinking += game_thinking
+            outcomes[outcome] = outcomes.get(outcome, 0) + 1
+        endings = ", ".join(f"{count} {outcome}" for outcome, count in sorted(outcomes.items()))
+        print(f"  {planner:<10}avg score {sum(scores) / len(scores):>8.1f}   max {max(scores):>6}"
+              f"   {1000 * thinking / decisions:>7.3f} ms/decision   ({endings})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Query time of weighted-terrain A* with a bucket queue vs a binary heap.
+
+    python bench_weighted_grid.py --sizes 256 512 1024 2048 --queries 3
+"""
+import argparse
+import random
+import time
+
+from weighted_grid import WeightedGridAStar
+
+GRASS, ROAD, MUD, WATER = 2, 1, 4, 8
+
+
+def terrain_map(size, rng):
+    """Grass crossed by roads, with patches of mud and water and a few walls."""
+    weights = bytearray([GRASS]) * (size * size)
+
+    def patch(weight, count, largest):
+        for _ in range(count):
+            height, width = rng.randint(2, largest), rng.randint(2, largest)
+            top, left = rng.randrange(size - height), rng.randrange(size - width)
+            for row in range(top, top + height):
+                weights[row * size + left:row * size + left + width] = bytes([weight]) * width
+
+    patch(MUD, size // 4, size // 12 + 2)
+    patch(WATER, size // 8, size // 10 + 2)
+    patch(0, size // 8, size // 20 + 2)
+    for line in range(rng.randrange(32), size, 64):
+        weights[line * size:(line + 1) * size] = bytes([ROAD]) * size  # East-west road
+        for row in range(size):
+            weights[row * size + line] = ROAD  # North-south road
+    return weights
+
+
+def open_cells(engine, size, rng, count):
+    cells = []
+    while len(cells) < count:
+        cell = (rng.randrange(size), rng.randrange(size))
+        if not engine.is_blocked(*cell):
+            cells.append(cell)
+    return cells
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[256, 512, 1024, 2048])
+    parser.add_argument("--queries", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    for size in args.sizes:
+        engine = WeightedGridAStar(size, size, terrain_map(size, rng))
+        cells = open_cells(engine, size, rng, 2 * args.queries)
+        pairs = list(zip(cells[::2], cells[1::2]))
+        print(f"{size}x{size} weighted map:")
+        for label, search in (("bucket queue", engine.find_path), ("binary heap", engine.find_path_heap)):
+            expanded = 0
+            costs = []
+            start = time.perf_counter()
+            for src, dst in pairs:
+                search(src, dst)
+                expanded += engine.expanded
+                costs.append(engine.cost)
+            elapsed = time.perf_counter() - start
+            print(f"  {label:<14}{1000 * elapsed / len(pairs):>10.1f} ms/query{expanded / len(pairs):>12.0f} expansions"
+                  f"   path costs {costs}")
+
+
+if __name__ == "__main__":
+    main()
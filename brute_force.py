@@ -1,16 +1,26 @@
 import itertools
+from functools import lru_cache
 
-def find_winner(state):
-    """Check the board and return the winner symbol if any."""
-    win_patterns = [
-        (0, 1, 2), (3, 4, 5), (6, 7, 8),   # Horizontal
-        (0, 3, 6), (1, 4, 7), (2, 5, 8),   # Vertical
-        (0, 4, 8), (2, 4, 6)               # Diagonal
-    ]
 
-    for x, y, z in win_patterns:
-        if state[x] == state[y] == state[z] and state[x] != " ":
-            return state[x]  # 'X' or 'O'
+@lru_cache(maxsize=None)
+def winning_lines(rows=3, cols=3, k=3):
+    """Every k-in-a-row line of a rows x cols board, as tuples of cell indexes."""
+    lines = []
+    for row in range(rows):
+        for col in range(cols):
+            # Horizontal, vertical, diagonal, anti-diagonal
+            for d_row, d_col in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                end_row, end_col = row + d_row * (k - 1), col + d_col * (k - 1)
+                if 0 <= end_row < rows and 0 <= end_col < cols:
+                    lines.append(tuple((row + d_row * i) * cols + col + d_col * i for i in range(k)))
+    return tuple(lines)
+
+def find_winner(state, rows=3, cols=3, k=3):
+    """Check the board and return the winner symbol if any."""
+    for line in winning_lines(rows, cols, k):
+        first = state[line[0]]
+        if first != " " and all(state[cell] == first for cell in line):
+            return first  # 'X' or 'O'
     return None
 
 def open_positions(state):
@@ -57,12 +67,219 @@ def optimal_move_search(state, current):
 
     return best_choice
 
-# Example usage
-board_state = [
-    "X", "O", "X",
-    " ", "O", " ",
-    " ", " ", "X"
-]
+# Transposition table entry kinds: the stored value is exact, or only a bound
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+class MNKSolver:
+    """
+    Full-depth alpha-beta (negamax) solver for m,n,k-games: tic-tac-toe is
+    3x3 with 3 in a row, and 4x4 or 5x5 boards with k in a row work the same.
+
+    A position is two bitboards, the stones of the side to move and of the
+    other side, so a move is one OR and a win is a mask test against the
+    k-in-a-row lines through the cell just played. Solved positions go in
+    a transposition table under the smallest key among the board's
+    rotations and reflections, so symmetric positions are searched once.
+    The table persists between queries, and answers are kept per exact
+    position, so a repeated query is a single dictionary lookup.
+
+    Scores are from the side to move: positive wins, 0 draws, negative
+    loses, larger the sooner the game ends in that result.
+    """
+
+    def __init__(self, rows=3, cols=3, k=3):
+        self.rows, self.cols, self.k = rows, cols, k
+        self.cells = rows * cols
+        self.full = (1 << self.cells) - 1
+        self.table = {}  # canonical key -> (value, EXACT | LOWER | UPPER)
+        self.answers = {}  # (mine, theirs) -> solve() result, for repeated queries
+        self.nodes = 0  # Positions searched, across all queries
+
+        # Every k-in-a-row line as a mask, and the lines through each cell
+        self.lines = [sum(1 << cell for cell in line) for line in winning_lines(rows, cols, k)]
+        self.lines_through = [[line for line in self.lines if line >> cell & 1] for cell in range(self.cells)]
+
+        # Centre cells first: they sit on the most lines, so cutoffs come sooner
+        center_row, center_col = (rows - 1) / 2, (cols - 1) / 2
+        self.move_order = sorted(range(self.cells), key=lambda cell: (
+            abs(cell // cols - center_row) + abs(cell % cols - center_col), cell))
+
+        # Symmetries as cell permutations, applied to a key a byte at a time through lookup tables
+        transforms = [lambda r, c: (r, c), lambda r, c: (r, cols - 1 - c),
+                      lambda r, c: (rows - 1 - r, c), lambda r, c: (rows - 1 - r, cols - 1 - c)]
+        if rows == cols:
+            transforms += [lambda r, c: (c, r), lambda r, c: (cols - 1 - c, r),
+                           lambda r, c: (c, rows - 1 - r), lambda r, c: (cols - 1 - c, rows - 1 - r)]
+        key_bits = 2 * self.cells
+        self.symmetry_tables = []
+        for transform in transforms[1:]:
+            target = []
+            for cell in range(self.cells):
+                new_row, new_col = transform(cell // cols, cell % cols)
+                target.append(new_row * cols + new_col)
+            target += [self.cells + cell for cell in target]
+            chunks = []
+            for start in range(0, key_bits, 8):
+                chunks.append([sum(1 << target[start + bit] for bit in range(8)
+                                   if byte >> bit & 1 and start + bit < key_bits) for byte in range(256)])
+            self.symmetry_tables.append(chunks)
+
+    def _canonical(self, key):
+        best = key
+        for chunks in self.symmetry_tables:
+            mapped = 0
+            shift = 0
+            for table in chunks:
+                mapped |= table[key >> shift & 255]
+                shift += 8
+            if mapped < best:
+                best = mapped
+        return best
+
+    def _wins(self, stones, cell):
+        for line in self.lines_through[cell]:
+            if stones & line == line:
+                return True
+        return False
 
-move = optimal_move_search(board_state, "O")
-print(f"Recommended move for 'O': {move}")
+    def _negamax(self, mine, theirs, free, alpha, beta):
+        self.nodes += 1
+        empty = self.full & ~(mine | theirs)
+        # A win on the next move is worth free; nothing we do can score more
+        threats = []
+        for cell in self.move_order:
+            if empty >> cell & 1:
+                if self._wins(mine | 1 << cell, cell):
+                    return free
+                if self._wins(theirs | 1 << cell, cell):
+                    threats.append(cell)
+        if free == 1:
+            return 0
+        # The opponent wins next move unless we block; two threats can't both be blocked
+        if len(threats) > 1:
+            return -(free - 1)
+        if threats:
+            return -self._negamax(theirs, mine | 1 << threats[0], free - 1, -beta, -alpha)
+        # Otherwise the best we can do is win with our next move, the worst lose on theirs
+        beta = min(beta, free - 2)
+        alpha = max(alpha, -(free - 1))
+        if alpha >= beta:
+            return alpha
+
+        key = self._canonical(mine | theirs << self.cells)
+        entry = self.table.get(key)
+        if entry is not None:
+            value, kind = entry
+            if kind == EXACT:
+                return value
+            if kind == LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+
+        original_alpha = alpha
+        best = -free
+        for cell in self.move_order:
+            if not empty >> cell & 1:
+                continue
+            value = -self._negamax(theirs, mine | 1 << cell, free - 1, -beta, -alpha)
+            if value > best:
+                best = value
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+        kind = UPPER if best <= original_alpha else LOWER if best >= beta else EXACT
+        self.table[key] = (best, kind)
+        return best
+
+    def encode(self, state, current):
+        """(stones of current, stones of the other side) for a list board like find_winner's."""
+        mine = theirs = 0
+        for cell, mark in enumerate(state):
+            if mark == current:
+                mine |= 1 << cell
+            elif mark != " ":
+                theirs |= 1 << cell
+        return mine, theirs
+
+    def solve(self, state, current):
+        """Best (score, cell) for current to play on state; cell is None if the game is over."""
+        mine, theirs = self.encode(state, current)
+        answer = self.answers.get((mine, theirs))
+        if answer is not None:
+            return answer
+        answer = self.answers[(mine, theirs)] = self._solve_root(mine, theirs)
+        return answer
+
+    def _solve_root(self, mine, theirs):
+        empty = self.full & ~(mine | theirs)
+        free = bin(empty).count("1")
+        # Already decided: score it like the win that just happened, with no move to make
+        for stones, sign in ((theirs, -1), (mine, 1)):
+            if any(stones & line == line for line in self.lines):
+                return sign * (free + 1), None
+        best, best_cell = -free - 1, None
+        for cell in self.move_order:
+            if not empty >> cell & 1:
+                continue
+            if self._wins(mine | 1 << cell, cell):
+                return free, cell
+            value = 0 if free == 1 else -self._negamax(theirs, mine | 1 << cell, free - 1, -free, -best)
+            if value > best:
+                best, best_cell = value, cell
+        return (best if best_cell is not None else 0), best_cell
+
+    def best_move(self, state, current):
+        return self.solve(state, current)[1]
+
+
+if __name__ == "__main__":
+    import time
+
+    # Example usage
+    board_state = [
+        "X", "O", "X",
+        " ", "O", " ",
+        " ", " ", "X"
+    ]
+
+    move = optimal_move_search(board_state, "O")
+    print(f"Recommended move for 'O': {move}")
+
+    solver = MNKSolver()
+    score, move = solver.solve(board_state, "O")
+    print(f"Full-depth search for 'O': move {move}, score {score}")
+    finished = ["X", "O", "X",
+                " ", "O", " ",
+                " ", "O", "X"]
+    assert solver.solve(finished, "X") == (-4, None), "a won board has no move to make"
+
+    for rows, cols, k in ((3, 3, 3), (4, 4, 3), (4, 4, 4)):
+        solver = MNKSolver(rows, cols, k)
+        empty = [" "] * (rows * cols)
+        start = time.perf_counter()
+        score, move = solver.solve(empty, "X")
+        elapsed = time.perf_counter() - start
+        start = time.perf_counter()
+        solver.solve(empty, "X")
+        again = time.perf_counter() - start
+        outcome = "first player wins" if score > 0 else "draw" if score == 0 else "second player wins"
+        print(f"{rows}x{cols}, {k} in a row: {outcome} (move {move}), solved in {elapsed:.2f} s, "
+              f"{solver.nodes} nodes, {len(solver.table)} table entries; repeat query {1e6 * again:.0f} us")
+
+    # 5x5, 4 in a row from an opening; the empty board is a draw but takes minutes to prove
+    opening = [
+        " ", " ", " ", " ", " ",
+        " ", "X", "O", " ", " ",
+        " ", " ", "X", " ", " ",
+        " ", " ", " ", "O", " ",
+        " ", " ", " ", " ", " ",
+    ]
+    solver = MNKSolver(5, 5, 4)
+    start = time.perf_counter()
+    score, move = solver.solve(opening, "X")
+    print(f"5x5, 4 in a row opening: X plays {move} (score {score}), solved in {time.perf_counter() - start:.1f} s")
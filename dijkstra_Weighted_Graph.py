@@ -1,20 +1,428 @@
+import csv
+import heapq
+import itertools
+import mmap
+import os
+import random
+import struct
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+
+STORAGE_MODES = ("matrix", "csr")
+
+# Binary graph file: header, then offsets ('q'), targets ('i'), weights ('d'),
+# label offsets ('q'), nodes sorted by label ('i') and the UTF-8 label bytes,
+# each section starting on an 8-byte boundary so it can be cast in place
+_GRAPH_HEADER = struct.Struct('<8sqqq')  # magic, node_count, edge_count, label_bytes
+_GRAPH_MAGIC = b'WGRAPH01'
+
+
+def dijkstra_csr(offsets, targets, weights, source_node, node_count, stop_at=None):
+    """
+    Binary-heap Dijkstra over CSR arrays, O((V + E) log V).
+    The edges of node i are targets/weights[offsets[i]:offsets[i + 1]].
+    Works with any indexable buffers (array, memoryview, mmap views).
+    stop_at: optional nodes; the search ends once all of them are settled,
+    and only their costs (and those of nodes settled before) are final.
+    """
+    path_costs = [float('inf')] * node_count
+    path_costs[source_node] = 0
+    heap = [(0, source_node)]
+    remaining = None if stop_at is None else set(stop_at)
+
+    while heap:
+        cost, node = heapq.heappop(heap)
+        if cost > path_costs[node]:
+            continue  # Stale heap entry
+        if remaining is not None:
+            remaining.discard(node)
+            if not remaining:
+                break
+
+        for edge in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[edge]
+            new_cost = cost + weights[edge]
+            if new_cost < path_costs[neighbor]:
+                path_costs[neighbor] = new_cost
+                heapq.heappush(heap, (new_cost, neighbor))
+
+    return path_costs
+
+
+def _walk_back(previous, node):
+    path = []
+    while node is not None:
+        path.append(node)
+        node = previous[node]
+    return path
+
+
+def shortest_path_csr(offsets, targets, weights, source_node, target_node, bidirectional=False):
+    """
+    Point-to-point Dijkstra over CSR arrays that stops as soon as the target
+    is settled. Returns (cost, node_path), or (inf, []) if unreachable.
+    bidirectional: also search backwards from the target (edges are symmetric)
+    and stop once the two frontiers can no longer improve the best meeting point.
+    Costs live in dicts, so a query only touches the nodes it actually reaches.
+    """
+    if source_node == target_node:
+        return 0, [source_node]
+
+    if not bidirectional:
+        path_costs = {source_node: 0}
+        previous = {source_node: None}
+        settled = set()
+        heap = [(0, source_node)]
+        while heap:
+            cost, node = heapq.heappop(heap)
+            if node in settled:
+                continue
+            if node == target_node:
+                path = _walk_back(previous, node)
+                path.reverse()
+                return cost, path
+            settled.add(node)
+            for edge in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[edge]
+                new_cost = cost + weights[edge]
+                if new_cost < path_costs.get(neighbor, float('inf')):
+                    path_costs[neighbor] = new_cost
+                    previous[neighbor] = node
+                    heapq.heappush(heap, (new_cost, neighbor))
+        return float('inf'), []
+
+    # Index 0 searches forward from the source, index 1 backward from the target
+    path_costs = ({source_node: 0}, {target_node: 0})
+    previous = ({source_node: None}, {target_node: None})
+    settled = (set(), set())
+    heaps = ([(0, source_node)], [(0, target_node)])
+    best_cost, meeting_node = float('inf'), None
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best_cost:
+            break  # No remaining path through either frontier can be shorter
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        cost, node = heapq.heappop(heaps[side])
+        if node in settled[side]:
+            continue
+        settled[side].add(node)
+        costs, other_costs = path_costs[side], path_costs[1 - side]
+
+        for edge in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[edge]
+            new_cost = cost + weights[edge]
+            if new_cost < costs.get(neighbor, float('inf')):
+                costs[neighbor] = new_cost
+                previous[side][neighbor] = node
+                heapq.heappush(heaps[side], (new_cost, neighbor))
+            if neighbor in other_costs and costs[neighbor] + other_costs[neighbor] < best_cost:
+                best_cost = costs[neighbor] + other_costs[neighbor]
+                meeting_node = neighbor
+
+    if meeting_node is None:
+        return float('inf'), []
+    path = _walk_back(previous[0], meeting_node)
+    path.reverse()
+    path.extend(_walk_back(previous[1], meeting_node)[1:])
+    return best_cost, path
+
+
+# Per-worker view of the graph published by compute_shortest_paths_many
+_shared_graph = None
+
+
+def _attach_shared_graph(block_names, node_count, edge_count):
+    """Process-pool initializer: map the parent's CSR blocks read-only, no pickling."""
+    global _shared_graph
+    blocks = []
+    for name in block_names:
+        blocks.append(shared_memory.SharedMemory(name=name))
+    # Blocks may be rounded up to a page, so slice them back to the array lengths
+    offsets = blocks[0].buf[:8 * (node_count + 1)].cast('q')
+    targets = blocks[1].buf[:4 * edge_count].cast('i')
+    weights = blocks[2].buf[:8 * edge_count].cast('d')
+    _shared_graph = (blocks, offsets, targets, weights, node_count)
+
+
+def _attach_graph_file(path):
+    """Process-pool initializer: map the saved graph file, sharing its pages with every other process."""
+    global _shared_graph
+    graph = WeightedGraph.load(path)
+    offsets, targets, weights = graph.to_csr()
+    _shared_graph = (graph, offsets, targets, weights, graph.node_count)
+
+
+def _shortest_paths_worker(source_node):
+    _, offsets, targets, weights, node_count = _shared_graph
+    return source_node, array('d', dijkstra_csr(offsets, targets, weights, source_node, node_count))
+
+
+def _padded(data):
+    raw = memoryview(data).cast('B')
+    return raw, b'\0' * (-len(raw) % 8)
+
+
+def _write_graph_file(path, offsets, targets, weights, labels):
+    encoded = [label.encode('utf-8') for label in labels]
+    label_offsets = array('q', [0])
+    for label in encoded:
+        label_offsets.append(label_offsets[-1] + len(label))
+    label_order = array('i', sorted(range(len(encoded)), key=encoded.__getitem__))
+    with open(path, 'wb') as file:
+        file.write(_GRAPH_HEADER.pack(_GRAPH_MAGIC, len(offsets) - 1, len(targets), label_offsets[-1]))
+        for data in (array('q', offsets), array('i', targets), array('d', weights), label_offsets, label_order):
+            file.writelines(_padded(data))
+        file.writelines(encoded)
+
+
+class _MappedLabels:
+    """Node labels read straight from a mapped graph file, decoded one at a time on access."""
+
+    def __init__(self, mapping, offsets, order, start):
+        self._mapping = mapping
+        self._offsets = offsets
+        self._order = order  # Node numbers sorted by label bytes, for binary search
+        self._start = start
+
+    def _raw(self, node):
+        return self._mapping[self._start + self._offsets[node]:self._start + self._offsets[node + 1]]
+
+    def __len__(self):
+        return len(self._order)
+
+    def __getitem__(self, node):
+        if not 0 <= node < len(self._order):
+            raise IndexError(node)
+        return self._raw(node).decode('utf-8')
+
+    def __iter__(self):
+        return (self[node] for node in range(len(self)))
+
+    def get(self, label, default=None):
+        """Node with this label, found by binary search over the sorted label order."""
+        raw = label.encode('utf-8')
+        low, high = 0, len(self._order)
+        while low < high:
+            middle = (low + high) // 2
+            if self._raw(self._order[middle]) < raw:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self._order) and self._raw(self._order[low]) == raw:
+            return self._order[low]
+        return default
+
+
 class WeightedGraph:
-    def __init__(self, node_count):
-        self.connection_matrix = [[0] * node_count for _ in range(node_count)]
+    def __init__(self, node_count, storage="matrix"):
+        """
+        storage: "matrix" keeps the dense connection_matrix (O(V^2) memory),
+                 "csr" keeps sparse adjacency lists that are packed into
+                 array-backed offsets/targets/weights on the first query.
+        """
+        if storage not in STORAGE_MODES:
+            raise ValueError(f"Unknown storage mode {storage!r}, expected one of {STORAGE_MODES}")
+        self.storage = storage
         self.node_count = node_count
         self.node_labels = [''] * node_count
+        self.label_index = {}  # label -> node, replaces linear node_labels.index lookups
+        if storage == "matrix":
+            self.connection_matrix = [[0] * node_count for _ in range(node_count)]
+            self.adjacency = None
+        else:
+            self.connection_matrix = None
+            self.adjacency = [{} for _ in range(node_count)]
+        self._csr = None  # Cached (offsets, targets, weights), dropped on every edit
+        self._mapping = None  # Open mmap when loaded from a graph file
+        self.path = None
+
+    def _check_writable(self):
+        if self._mapping is not None:
+            raise ValueError("Graph is memory-mapped from a file and read-only")
 
     def create_connection(self, node1, node2, cost):
+        self._check_writable()
         if 0 <= node1 < self.node_count and 0 <= node2 < self.node_count:
-            self.connection_matrix[node1][node2] = cost
-            self.connection_matrix[node2][node1] = cost  # Bidirectional connection
+            self._csr = None
+            if self.storage == "matrix":
+                self.connection_matrix[node1][node2] = cost
+                self.connection_matrix[node2][node1] = cost  # Bidirectional connection
+            elif cost > 0:
+                self.adjacency[node1][node2] = cost
+                self.adjacency[node2][node1] = cost
+            else:
+                # A zero cost means "no connection", same as in the matrix
+                self.adjacency[node1].pop(node2, None)
+                self.adjacency[node2].pop(node1, None)
+
+    def connection_cost(self, node1, node2):
+        """Cost of the node1 - node2 connection, 0 if there is none."""
+        if self.storage == "matrix":
+            return self.connection_matrix[node1][node2]
+        if self.adjacency is None:
+            return min((cost for neighbor, cost in self.neighbors(node1) if neighbor == node2), default=0)
+        return self.adjacency[node1].get(node2, 0)
+
+    def neighbors(self, node):
+        """(neighbor, cost) pairs of a node, read from the live edge storage."""
+        if self.storage == "matrix":
+            return [(neighbor, cost) for neighbor, cost in enumerate(self.connection_matrix[node]) if cost > 0]
+        if self.adjacency is None:
+            offsets, targets, weights = self._csr
+            return list(zip(targets[offsets[node]:offsets[node + 1]], weights[offsets[node]:offsets[node + 1]]))
+        return self.adjacency[node].items()
+
+    def to_csr(self):
+        """Return the graph as CSR arrays (offsets, targets, weights)."""
+        if self._csr is None:
+            offsets = array('q', [0])
+            targets = array('i')
+            weights = array('d')
+            if self.storage == "matrix":
+                for row in self.connection_matrix:
+                    for neighbor, cost in enumerate(row):
+                        if cost > 0:
+                            targets.append(neighbor)
+                            weights.append(cost)
+                    offsets.append(len(targets))
+            else:
+                for edges in self.adjacency:
+                    targets.extend(edges.keys())
+                    weights.extend(edges.values())
+                    offsets.append(len(targets))
+            self._csr = (offsets, targets, weights)
+        return self._csr
+
+    def save(self, path):
+        """Write the CSR arrays and labels in the binary graph format read by load."""
+        offsets, targets, weights = self.to_csr()
+        _write_graph_file(path, offsets, targets, weights, self.node_labels)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Memory-map a saved graph: nothing is parsed or copied, so it is ready
+        for queries as soon as the header is read, and processes mapping the
+        same file share its pages. The graph is read-only; labels are looked
+        up by binary search in the file.
+        """
+        with open(path, 'rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, node_count, edge_count, label_bytes = _GRAPH_HEADER.unpack_from(mapping)
+        if magic != _GRAPH_MAGIC:
+            mapping.close()
+            raise ValueError(f"{path} is not a graph file")
+
+        view = memoryview(mapping)
+        sections = []
+        start = _GRAPH_HEADER.size
+        for typecode, count in (('q', node_count + 1), ('i', edge_count), ('d', edge_count),
+                                ('q', node_count + 1), ('i', node_count)):
+            size = array(typecode).itemsize * count
+            sections.append(view[start:start + size].cast(typecode))
+            start += size + -size % 8
+        offsets, targets, weights, label_offsets, label_order = sections
+
+        graph = cls.__new__(cls)
+        graph.storage = "csr"
+        graph.node_count = node_count
+        graph.connection_matrix = None
+        graph.adjacency = None
+        graph._csr = (offsets, targets, weights)
+        # One object serves both directions: node -> label by index, label -> node through get()
+        graph.node_labels = graph.label_index = _MappedLabels(mapping, label_offsets, label_order, start)
+        graph._mapping = mapping
+        graph._views = sections + [view]
+        graph.path = path
+        return graph
+
+    def close(self):
+        if self._mapping is not None:
+            for view in self._views:
+                view.release()
+            self._mapping.close()
+            self._mapping = None
+
+    @staticmethod
+    def import_edge_list(source_path, graph_path, delimiter=None, chunk_rows=65536):
+        """
+        Convert a "source,target,cost" edge list (CSV, or TSV when the file
+        name ends in .tsv) into a graph file for load, streaming it in chunks
+        of rows. Labels are numbered in order of first appearance, edges are
+        symmetric like create_connection, a header row is skipped, and rows
+        with a cost of 0 or less add no connection. Returns (node_count, edge_count).
+        """
+        if delimiter is None:
+            delimiter = '\t' if source_path.endswith('.tsv') else ','
+        label_index = {}
+        sources, destinations, costs = array('i'), array('i'), array('d')
+        with open(source_path, newline='', encoding='utf-8') as file:
+            rows = csv.reader(file, delimiter=delimiter)
+            first_chunk = True
+            while True:
+                chunk = list(itertools.islice(rows, chunk_rows))
+                if not chunk:
+                    break
+                if first_chunk:
+                    first_chunk = False
+                    try:
+                        float(chunk[0][2])
+                    except (IndexError, ValueError):
+                        chunk = chunk[1:]  # Header row
+                for row in chunk:
+                    if len(row) < 3:
+                        continue
+                    cost = float(row[2])
+                    if cost <= 0:
+                        continue
+                    sources.append(label_index.setdefault(row[0], len(label_index)))
+                    destinations.append(label_index.setdefault(row[1], len(label_index)))
+                    costs.append(cost)
+
+        # Counting sort of both directions of every edge into CSR order
+        node_count = len(label_index)
+        offsets = array('q', bytes(8 * (node_count + 1)))
+        for node in itertools.chain(sources, destinations):
+            offsets[node + 1] += 1
+        for node in range(node_count):
+            offsets[node + 1] += offsets[node]
+        fill = array('q', offsets[:-1])
+        targets = array('i', bytes(4 * 2 * len(costs)))
+        weights = array('d', bytes(8 * 2 * len(costs)))
+        for node1, node2, cost in zip(sources, destinations, costs):
+            for here, there in ((node1, node2), (node2, node1)):
+                slot = fill[here]
+                targets[slot] = there
+                weights[slot] = cost
+                fill[here] = slot + 1
+
+        _write_graph_file(graph_path, offsets, targets, weights, label_index)
+        return node_count, len(targets)
 
     def assign_label(self, node, label):
+        self._check_writable()
         if 0 <= node < self.node_count:
+            old_label = self.node_labels[node]
+            if self.label_index.get(old_label) == node:
+                del self.label_index[old_label]
             self.node_labels[node] = label
+            self.label_index[label] = node
+
+    def node_index(self, label):
+        """Resolve a label to its node number in O(1)."""
+        node = self.label_index.get(label)
+        if node is None:
+            raise ValueError(f"{label!r} is not a node label")
+        return node
 
     def compute_shortest_paths(self, source_label):
-        source_node = self.node_labels.index(source_label)
+        source_node = self.node_index(source_label)
+        if self.storage == "csr":
+            offsets, targets, weights = self.to_csr()
+            return dijkstra_csr(offsets, targets, weights, source_node, self.node_count)
+
+        # Dense matrix: linear scan for the next node, O(V^2)
         path_costs = [float('inf')] * self.node_count
         path_costs[source_node] = 0
         processed_nodes = [False] * self.node_count
@@ -41,31 +449,146 @@ class WeightedGraph:
         
         return path_costs
 
-# Create a transportation network with 7 locations
-transport_network = WeightedGraph(7)
-
-transport_network.assign_label(0, 'Central')
-transport_network.assign_label(1, 'North')
-transport_network.assign_label(2, 'East')
-transport_network.assign_label(3, 'West')
-transport_network.assign_label(4, 'South')
-transport_network.assign_label(5, 'Airport')
-transport_network.assign_label(6, 'Harbor')
-
-# Establish connections with travel times
-transport_network.create_connection(3, 0, 4)  # West - Central, 4 mins
-transport_network.create_connection(3, 4, 2)  # West - South, 2 mins
-transport_network.create_connection(0, 2, 3)  # Central - East, 3 mins
-transport_network.create_connection(0, 4, 4)  # Central - South, 4 mins
-transport_network.create_connection(2, 4, 4)  # East - South, 4 mins
-transport_network.create_connection(4, 6, 5)  # South - Harbor, 5 mins
-transport_network.create_connection(2, 5, 5)  # East - Airport, 5 mins
-transport_network.create_connection(2, 1, 2)  # East - North, 2 mins
-transport_network.create_connection(1, 5, 2)  # North - Airport, 2 mins
-transport_network.create_connection(6, 5, 5)  # Harbor - Airport, 5 mins
-
-# Calculate shortest travel times from West station
-print("Optimal travel times from West station:\n")
-travel_times = transport_network.compute_shortest_paths('West')
-for i, time in enumerate(travel_times):
-    print(f"Minimum time from West to {transport_network.node_labels[i]}: {time}")
\ No newline at end of file
+    def compute_shortest_paths_many(self, sources, workers=None):
+        """
+        Shortest paths from many source labels, spread over a process pool.
+        The CSR arrays are copied once into shared memory and mapped by every
+        worker. Yields (source_label, path_costs) rows as they finish, in
+        completion order; path_costs is an array('d') indexed by node.
+        workers: pool size (default os.cpu_count()), 1 runs in this process.
+        """
+        source_nodes = [self.node_index(label) for label in sources]
+
+        offsets, targets, weights = self.to_csr()
+        workers = workers or os.cpu_count() or 1
+        if workers == 1 or len(source_nodes) <= 1:
+            for node in source_nodes:
+                yield self.node_labels[node], array('d', dijkstra_csr(offsets, targets, weights, node, self.node_count))
+            return
+
+        if self.path is not None:
+            # Already in a file: every worker maps it, no copy into shared memory
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach_graph_file,
+                                     initargs=(self.path,)) as pool:
+                yield from self._completed_rows(pool, source_nodes, workers)
+            return
+
+        blocks = []
+        try:
+            for data in (offsets, targets, weights):
+                raw = memoryview(data).cast('B')
+                block = shared_memory.SharedMemory(create=True, size=max(1, len(raw)))
+                block.buf[:len(raw)] = raw
+                blocks.append(block)
+
+            with ProcessPoolExecutor(max_workers=workers, initializer=_attach_shared_graph,
+                                     initargs=([block.name for block in blocks], self.node_count, len(targets))) as pool:
+                yield from self._completed_rows(pool, source_nodes, workers)
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+    def _completed_rows(self, pool, source_nodes, workers):
+        """Yield (label, path_costs) as workers finish, with a bounded number of rows in flight."""
+        # Bounded so huge batches don't pile up in memory
+        pending = set()
+        queued = iter(source_nodes)
+        for node in queued:
+            pending.add(pool.submit(_shortest_paths_worker, node))
+            if len(pending) >= 4 * workers:
+                break
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                node, path_costs = future.result()
+                yield self.node_labels[node], path_costs
+                next_node = next(queued, None)
+                if next_node is not None:
+                    pending.add(pool.submit(_shortest_paths_worker, next_node))
+
+    def shortest_path(self, src_label, dst_label, bidirectional=False):
+        """
+        Cheapest route between two labels, stopping once dst_label is settled.
+        Returns (cost, [labels along the route]), or (inf, []) if unreachable.
+        """
+        offsets, targets, weights = self.to_csr()
+        cost, path = shortest_path_csr(offsets, targets, weights,
+                                       self.node_index(src_label), self.node_index(dst_label),
+                                       bidirectional)
+        return cost, [self.node_labels[node] for node in path]
+
+
+def road_network(side, storage, seed):
+    """
+    side x side grid of nodes labelled "0".."side*side - 1", with random
+    travel times and ~10% of the roads missing; a test network for the
+    benchmarks and the path service.
+    """
+    rng = random.Random(seed)
+    graph = WeightedGraph(side * side, storage=storage)
+    for node in range(side * side):
+        graph.assign_label(node, str(node))
+    for row in range(side):
+        for col in range(side):
+            node = row * side + col
+            if col + 1 < side and rng.random() > 0.1:
+                graph.create_connection(node, node + 1, rng.randint(1, 10))
+            if row + 1 < side and rng.random() > 0.1:
+                graph.create_connection(node, node + side, rng.randint(1, 10))
+    return graph
+
+
+if __name__ == "__main__":
+    # Create a transportation network with 7 locations
+    transport_network = WeightedGraph(7)
+
+    transport_network.assign_label(0, 'Central')
+    transport_network.assign_label(1, 'North')
+    transport_network.assign_label(2, 'East')
+    transport_network.assign_label(3, 'West')
+    transport_network.assign_label(4, 'South')
+    transport_network.assign_label(5, 'Airport')
+    transport_network.assign_label(6, 'Harbor')
+
+    # Establish connections with travel times
+    transport_network.create_connection(3, 0, 4)  # West - Central, 4 mins
+    transport_network.create_connection(3, 4, 2)  # West - South, 2 mins
+    transport_network.create_connection(0, 2, 3)  # Central - East, 3 mins
+    transport_network.create_connection(0, 4, 4)  # Central - South, 4 mins
+    transport_network.create_connection(2, 4, 4)  # East - South, 4 mins
+    transport_network.create_connection(4, 6, 5)  # South - Harbor, 5 mins
+    transport_network.create_connection(2, 5, 5)  # East - Airport, 5 mins
+    transport_network.create_connection(2, 1, 2)  # East - North, 2 mins
+    transport_network.create_connection(1, 5, 2)  # North - Airport, 2 mins
+    transport_network.create_connection(6, 5, 5)  # Harbor - Airport, 5 mins
+
+    # Calculate shortest travel times from West station
+    print("Optimal travel times from West station:\n")
+    travel_times = transport_network.compute_shortest_paths('West')
+    for i, time in enumerate(travel_times):
+        print(f"Minimum time from West to {transport_network.node_labels[i]}: {time}")
+
+    cost, route = transport_network.shortest_path('West', 'Airport', bidirectional=True)
+    print(f"\nFastest route West -> Airport ({cost:g} mins): {' -> '.join(route)}")
+
+    # Travel-time table from every station, computed in parallel
+    print("\nTravel-time table:\n")
+    for label, row in transport_network.compute_shortest_paths_many(transport_network.node_labels, workers=2):
+        print(f"{label:>8}: {[int(cost) for cost in row]}")
+
+    # Save to the binary format and map it back: the loaded graph answers the same queries
+    import tempfile
+    import time as timer
+
+    with tempfile.TemporaryDirectory() as directory:
+        graph_path = os.path.join(directory, 'transport.wgraph')
+        transport_network.save(graph_path)
+        start = timer.perf_counter()
+        mapped_network = WeightedGraph.load(graph_path)
+        load_ms = 1000 * (timer.perf_counter() - start)
+        assert list(mapped_network.compute_shortest_paths('West')) == list(travel_times)
+        cost, route = mapped_network.shortest_path('West', 'Airport')
+        print(f"\nMapped {os.path.getsize(graph_path)}-byte graph file in {load_ms:.2f} ms; "
+              f"West -> Airport {cost:g} mins: {' -> '.join(route)}")
+        mapped_network.close()
@@ -0,0 +1,143 @@
+import heapq
+from array import array
+
+from grid_astar import GridAStar
+
+INF = float("inf")
+
+
+class DStarLite:
+    """
+    Incremental 4-connected grid planner (D* Lite, Koenig & Likhachev).
+
+    The search runs backwards from the goal and keeps its g/rhs values
+    between calls. When a cell becomes a wall or is cleared, only the
+    vertices whose costs actually change are put back on the queue, and the
+    next find_path repairs just that part of the search. The start may
+    move (a unit walking its path) without losing any work.
+
+    The grid is a GridAStar engine; its blocked buffer is shared, so walls
+    must be changed through set_blocked to keep the planner consistent.
+    """
+
+    def __init__(self, engine, start, goal):
+        self.engine = engine
+        self.rows, self.cols = engine.rows, engine.cols
+        self.blocked = engine.blocked
+        size = self.rows * self.cols
+        self.g = array('d', [INF]) * size
+        self.rhs = array('d', [INF]) * size
+        self.queue = []
+        self.queued = {}  # cell -> its current key; heap entries with any other key are stale
+        self.km = 0  # Heuristic offset accumulated as the start moves
+        self.start = start[0] * self.cols + start[1]
+        self.last_start = self.start
+        self.goal = goal[0] * self.cols + goal[1]
+        self.expanded = 0  # Vertices expanded by the last find_path
+
+        self.rhs[self.goal] = 0
+        self._push(self.goal)
+
+    @classmethod
+    def from_layout(cls, layout, start, goal):
+        return cls(GridAStar.from_layout(layout), start, goal)
+
+    def _heuristic(self, a, b):
+        a_row, a_col = divmod(a, self.cols)
+        b_row, b_col = divmod(b, self.cols)
+        return abs(a_row - b_row) + abs(a_col - b_col)
+
+    def _key(self, cell):
+        best = min(self.g[cell], self.rhs[cell])
+        return best + self._heuristic(self.start, cell) + self.km, best
+
+    def _push(self, cell):
+        key = self._key(cell)
+        self.queued[cell] = key
+        heapq.heappush(self.queue, (key, cell))
+
+    def _top_key(self):
+        while self.queue:
+            key, cell = self.queue[0]
+            if self.queued.get(cell) == key:
+                return key
+            heapq.heappop(self.queue)  # Stale entry
+        return INF, INF
+
+    def _neighbors(self, cell):
+        cols = self.cols
+        row, col = divmod(cell, cols)
+        if row > 0:
+            yield cell - cols
+        if row < self.rows - 1:
+            yield cell + cols
+        if col > 0:
+            yield cell - 1
+        if col < cols - 1:
+            yield cell + 1
+
+    def _update_vertex(self, cell):
+        if cell != self.goal:
+            best = INF
+            if not self.blocked[cell]:
+                for neighbor in self._neighbors(cell):
+                    if not self.blocked[neighbor] and self.g[neighbor] + 1 < best:
+                        best = self.g[neighbor] + 1
+            self.rhs[cell] = best
+        self.queued.pop(cell, None)
+        if self.g[cell] != self.rhs[cell]:
+            self._push(cell)
+
+    def _compute_shortest_path(self):
+        g, rhs = self.g, self.rhs
+        start = self.start
+        expanded = 0
+        while self._top_key() < self._key(start) or rhs[start] != g[start]:
+            old_key, cell = heapq.heappop(self.queue)
+            del self.queued[cell]
+            new_key = self._key(cell)
+            expanded += 1
+            if old_key < new_key:
+                self._push(cell)
+            elif g[cell] > rhs[cell]:
+                g[cell] = rhs[cell]
+                for neighbor in self._neighbors(cell):
+                    self._update_vertex(neighbor)
+            else:
+                g[cell] = INF
+                self._update_vertex(cell)
+                for neighbor in self._neighbors(cell):
+                    self._update_vertex(neighbor)
+        self.expanded = expanded
+
+    def set_blocked(self, row, col, blocked=True):
+        """A cell became a wall (or was cleared): queue only the vertices whose costs changed."""
+        cell = row * self.cols + col
+        if self.blocked[cell] == bool(blocked):
+            return
+        self.blocked[cell] = bool(blocked)
+        self._update_vertex(cell)
+        for neighbor in self._neighbors(cell):
+            self._update_vertex(neighbor)
+
+    def move_start(self, start):
+        """The unit moved: keep the search, just shift the heuristic offset."""
+        self.start = start[0] * self.cols + start[1]
+        self.km += self._heuristic(self.last_start, self.start)
+        self.last_start = self.start
+
+    def find_path(self):
+        """Repair the search and return the path start -> goal as (row, col) cells, or None."""
+        if self.blocked[self.start] or self.blocked[self.goal]:
+            return None
+        self._compute_shortest_path()
+        if self.g[self.start] == INF:
+            return None
+
+        # Walk downhill on g from the start; each step is one cheaper
+        cell = self.start
+        path = [divmod(cell, self.cols)]
+        while cell != self.goal:
+            cell = min((n for n in self._neighbors(cell) if not self.blocked[n]), key=self.g.__getitem__)
+            path.append(divmod(cell, self.cols))
+        return path
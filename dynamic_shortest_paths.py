@@ -0,0 +1,125 @@
+import heapq
+
+from dijkstra_Weighted_Graph import WeightedGraph
+
+
+class DynamicShortestPaths:
+    """
+    Keeps shortest-path trees for registered sources up to date while edge
+    costs change (Ramalingam-Reps style). Every edit goes through
+    update_connection, which changes the graph and then repairs each tree:
+
+    - a cheaper or new edge can only shorten paths, so the improvement is
+      pushed outwards from its endpoints with a Dijkstra that stops where
+      nothing improves;
+    - a dearer or removed edge only matters if it is a tree edge. Then just
+      the subtree hanging below it is reset and re-settled from its
+      unaffected boundary.
+
+    Unaffected parts of the trees are never touched.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.trees = {}  # source label -> (path_costs, parents)
+        self.repaired_nodes = 0  # Nodes whose cost was re-settled by repairs, for monitoring
+
+    def add_source(self, source_label):
+        source_node = self.graph.node_index(source_label)
+        path_costs = [float('inf')] * self.graph.node_count
+        parents = [None] * self.graph.node_count
+        path_costs[source_node] = 0
+        self._propagate(path_costs, parents, [(0, source_node)])
+        self.trees[source_label] = (path_costs, parents)
+
+    def remove_source(self, source_label):
+        del self.trees[source_label]
+
+    def path_costs(self, source_label):
+        """Current costs from a registered source, same layout as compute_shortest_paths (do not modify)."""
+        return self.trees[source_label][0]
+
+    def update_connection(self, node1, node2, cost):
+        """Insert, delete (cost 0) or re-weight an edge and repair every registered tree."""
+        old_cost = self.graph.connection_cost(node1, node2)
+        self.graph.create_connection(node1, node2, cost)
+        new_cost = self.graph.connection_cost(node1, node2)
+        if new_cost == old_cost:
+            return
+
+        for path_costs, parents in self.trees.values():
+            if new_cost and (not old_cost or new_cost < old_cost):
+                self._repair_decrease(path_costs, parents, node1, node2, new_cost)
+            elif parents[node2] == node1:
+                self._repair_increase(path_costs, parents, node2)
+            elif parents[node1] == node2:
+                self._repair_increase(path_costs, parents, node1)
+            # A dearer edge outside the tree cannot change any cost
+
+    def _propagate(self, path_costs, parents, heap):
+        """Dijkstra from pre-seeded heap entries; stops expanding where costs don't improve."""
+        heapq.heapify(heap)
+        while heap:
+            cost, node = heapq.heappop(heap)
+            if cost > path_costs[node]:
+                continue  # Stale heap entry
+            self.repaired_nodes += 1
+            for neighbor, edge_cost in self.graph.neighbors(node):
+                new_cost = cost + edge_cost
+                if new_cost < path_costs[neighbor]:
+                    path_costs[neighbor] = new_cost
+                    parents[neighbor] = node
+                    heapq.heappush(heap, (new_cost, neighbor))
+
+    def _repair_decrease(self, path_costs, parents, node1, node2, cost):
+        heap = []
+        for start, end in ((node1, node2), (node2, node1)):
+            if path_costs[start] + cost < path_costs[end]:
+                path_costs[end] = path_costs[start] + cost
+                parents[end] = start
+                heap.append((path_costs[end], end))
+        self._propagate(path_costs, parents, heap)
+
+    def _repair_increase(self, path_costs, parents, subtree_root):
+        # Collect the subtree whose tree path ran through the changed edge
+        affected = {subtree_root}
+        stack = [subtree_root]
+        while stack:
+            node = stack.pop()
+            for neighbor, _ in self.graph.neighbors(node):
+                if parents[neighbor] == node and neighbor not in affected:
+                    affected.add(neighbor)
+                    stack.append(neighbor)
+        for node in affected:
+            path_costs[node] = float('inf')
+            parents[node] = None
+
+        # Re-enter the subtree from its best unaffected neighbour, then settle it again
+        heap = []
+        for node in affected:
+            for neighbor, edge_cost in self.graph.neighbors(node):
+                if neighbor not in affected and path_costs[neighbor] + edge_cost < path_costs[node]:
+                    path_costs[node] = path_costs[neighbor] + edge_cost
+                    parents[node] = neighbor
+            if path_costs[node] < float('inf'):
+                heap.append((path_costs[node], node))
+        self._propagate(path_costs, parents, heap)
+
+
+if __name__ == "__main__":
+    network = WeightedGraph(7, storage="csr")
+    for node, label in enumerate(['Central', 'North', 'East', 'West', 'South', 'Airport', 'Harbor']):
+        network.assign_label(node, label)
+    for node1, node2, cost in [(3, 0, 4), (3, 4, 2), (0, 2, 3), (0, 4, 4), (2, 4, 4),
+                               (4, 6, 5), (2, 5, 5), (2, 1, 2), (1, 5, 2), (6, 5, 5)]:
+        network.create_connection(node1, node2, cost)
+
+    live = DynamicShortestPaths(network)
+    live.add_source('West')
+    print("West -> Airport:", live.path_costs('West')[5])
+
+    # Traffic jam on East - South, then the North - Airport road closes
+    live.update_connection(2, 4, 9)
+    print("After East - South slows to 9 mins:", live.path_costs('West')[5])
+    live.update_connection(1, 5, 0)
+    print("After North - Airport closes:", live.path_costs('West')[5])
@@ -0,0 +1,144 @@
+from array import array
+
+from grid_astar import GridAStar
+
+UNREACHABLE = -1
+NO_STEP = 255  # Direction code for the goal itself and for cells that can't reach it
+
+# Direction codes 0-3 as (row, col) offsets
+DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+class FlowField:
+    """
+    Distances and next steps to one goal for every cell of a GridAStar grid.
+
+    A single breadth-first search runs backwards from the goal and stores,
+    for each cell, its distance (array of ints, UNREACHABLE for walls and
+    cut-off cells) and the direction of its first step towards the goal
+    (one byte per cell). Any number of agents heading for that goal then
+    move with an O(1) lookup per step instead of searching from their own
+    start, and the shortest paths they follow are the same length.
+
+    The field is rebuilt lazily on the first lookup after the map changes,
+    so walls must be changed through set_blocked (or invalidate() called
+    after editing the engine directly).
+    """
+
+    def __init__(self, engine, goal):
+        self.engine = engine
+        self.rows, self.cols = engine.rows, engine.cols
+        self.goal = goal[0] * self.cols + goal[1]
+        size = self.rows * self.cols
+        self.distance = array('i', [UNREACHABLE]) * size
+        self.direction = bytearray([NO_STEP]) * size
+        self.queue = array('i', bytes(4 * size))
+        self.stale = True
+        self.builds = 0  # Times the field has been (re)computed
+
+    @classmethod
+    def from_layout(cls, layout, goal):
+        return cls(GridAStar.from_layout(layout), goal)
+
+    def set_blocked(self, row, col, blocked=True):
+        if self.engine.is_blocked(row, col) != bool(blocked):
+            self.engine.set_blocked(row, col, blocked)
+            self.stale = True
+
+    def invalidate(self):
+        self.stale = True
+
+    def rebuild(self):
+        cols, rows = self.cols, self.rows
+        size = rows * cols
+        blocked = self.engine.blocked
+        distance, direction, queue = self.distance, self.direction, self.queue
+        distance[:] = array('i', [UNREACHABLE]) * size
+        direction[:] = bytearray([NO_STEP]) * size
+        self.stale = False
+        self.builds += 1
+        goal = self.goal
+        if blocked[goal]:
+            return
+
+        distance[goal] = 0
+        queue[0] = goal
+        head, tail = 0, 1
+        while head < tail:
+            cell = queue[head]
+            head += 1
+            row, col = divmod(cell, cols)
+            step = distance[cell] + 1
+            # A neighbour reached from here steps back towards us: up from below, and so on
+            for neighbor, inside, code in ((cell - cols, row > 0, 1), (cell + cols, row < rows - 1, 0),
+                                           (cell - 1, col > 0, 3), (cell + 1, col < cols - 1, 2)):
+                if inside and distance[neighbor] == UNREACHABLE and not blocked[neighbor]:
+                    distance[neighbor] = step
+                    direction[neighbor] = code
+                    queue[tail] = neighbor
+                    tail += 1
+
+    def distance_to_goal(self, cell):
+        """Steps from (row, col) to the goal, or UNREACHABLE."""
+        if self.stale:
+            self.rebuild()
+        return self.distance[cell[0] * self.cols + cell[1]]
+
+    def next_step(self, cell):
+        """The (row, col) to move to from cell, or None at the goal or when the goal can't be reached."""
+        if self.stale:
+            self.rebuild()
+        code = self.direction[cell[0] * self.cols + cell[1]]
+        if code == NO_STEP:
+            return None
+        d_row, d_col = DIRECTIONS[code]
+        return cell[0] + d_row, cell[1] + d_col
+
+    def find_path(self, start, goal=None):
+        """Same contract as GridAStar.find_path for this field's goal (goal is only checked)."""
+        if goal is not None and goal[0] * self.cols + goal[1] != self.goal:
+            raise ValueError(f"Flow field leads to {divmod(self.goal, self.cols)}, not {tuple(goal)}")
+        if self.distance_to_goal(start) == UNREACHABLE:
+            return None
+        path = [tuple(start)]
+        cell = self.next_step(start)
+        while cell is not None:
+            path.append(cell)
+            cell = self.next_step(cell)
+        return path
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    rng = random.Random(3)
+    size = 256
+    layout = [["#" if rng.random() < 0.25 else "." for _ in range(size)] for _ in range(size)]
+    goal = (size // 2, size // 2)
+    layout[goal[0]][goal[1]] = "."
+    engine = GridAStar.from_layout(layout)
+    agents = []
+    while len(agents) < 300:
+        cell = (rng.randrange(size), rng.randrange(size))
+        if not engine.is_blocked(*cell):
+            agents.append(cell)
+
+    start_time = time.perf_counter()
+    searched = [engine.find_path(agent, goal) for agent in agents]
+    search_time = time.perf_counter() - start_time
+
+    field = FlowField(engine, goal)
+    start_time = time.perf_counter()
+    flowed = [field.find_path(agent) for agent in agents]
+    field_time = time.perf_counter() - start_time
+    assert [path and len(path) for path in searched] == [path and len(path) for path in flowed]
+    print(f"{len(agents)} agents on a {size}x{size} map: one A* each {1000 * search_time:.0f} ms, "
+          f"one flow field {1000 * field_time:.0f} ms (paths of equal length)")
+
+    # One tick of movement for every agent is now a lookup each
+    start_time = time.perf_counter()
+    for _ in range(100):
+        agents = [field.next_step(agent) or agent for agent in agents]
+    print(f"100 ticks of {len(agents)} agents: {1e6 * (time.perf_counter() - start_time) / 100 / len(agents):.2f} us "
+          f"per agent step, {field.builds} field build(s)")
@@ -0,0 +1,196 @@
+import heapq
+from array import array
+
+WALL = "#"
+
+# Event kinds emitted by GridAStar.search_events
+OPENED, CLOSED, PATH = "open", "closed", "path"
+
+
+class GridAStar:
+    """
+    A* on a flat occupancy grid with integer cell indices (index = row * cols + col).
+
+    Search state (g-scores, parents) lives in preallocated arrays that are
+    reused by every call. Instead of clearing them, each search bumps a
+    generation counter and a cell's entry only counts if its stamp matches,
+    so a query costs nothing for the cells it never reaches.
+    """
+
+    def __init__(self, rows, cols, blocked=None):
+        self.rows = rows
+        self.cols = cols
+        size = rows * cols
+        self.blocked = bytearray(size) if blocked is None else bytearray(blocked)  # 1 = wall
+        self.g_score = array('i', bytes(4 * size))
+        self.came_from = array('i', bytes(4 * size))
+        self.stamp = array('I', bytes(4 * size))
+        self.generation = 0
+        self.expanded = 0  # Cells expanded by the last search
+
+    @classmethod
+    def from_layout(cls, layout, **options):
+        """Build from rows of cells (strings or lists) where "#" marks a wall."""
+        rows, cols = len(layout), len(layout[0])
+        blocked = bytearray(cell == WALL for row in layout for cell in row)
+        return cls(rows, cols, blocked, **options)
+
+    @classmethod
+    def from_grid(cls, grid, **options):
+        """Build from a 2D grid of Node objects; walls are "#" or nodes whose is_barrier() is true."""
+        rows, cols = len(grid), len(grid[0])
+        blocked = bytearray(
+            cell == WALL or (hasattr(cell, "is_barrier") and cell.is_barrier())
+            for row in grid for cell in row
+        )
+        return cls(rows, cols, blocked, **options)
+
+    def set_blocked(self, row, col, blocked=True):
+        self.blocked[row * self.cols + col] = blocked
+
+    def is_blocked(self, row, col):
+        return bool(self.blocked[row * self.cols + col])
+
+    def _next_generation(self):
+        self.generation += 1
+        if self.generation > 0xFFFFFFFF:
+            # Stamp counter wrapped: clear once so old stamps can't look current
+            self.stamp = array('I', bytes(4 * self.rows * self.cols))
+            self.generation = 1
+        return self.generation
+
+    def find_path(self, start, goal):
+        """
+        start, goal: (row, col) tuples.
+        Returns the path as a list of (row, col) from start to goal, in the
+        same format as reconstruct_path, or None if the goal is unreachable.
+        """
+        cols = self.cols
+        size = self.rows * cols
+        blocked = self.blocked
+        g_score = self.g_score
+        came_from = self.came_from
+        stamp = self.stamp
+        generation = self._next_generation()
+
+        start_index = start[0] * cols + start[1]
+        goal_index = goal[0] * cols + goal[1]
+        goal_row, goal_col = goal
+        if blocked[start_index] or blocked[goal_index]:
+            return None
+
+        g_score[start_index] = 0
+        came_from[start_index] = -1
+        stamp[start_index] = generation
+        start_h = abs(goal_row - start[0]) + abs(goal_col - start[1])
+        open_heap = [(start_h, start_h, start_index)]  # (f, h, cell): ties go to the cell nearer the goal
+        expanded = 0
+
+        while open_heap:
+            f, h, current = heapq.heappop(open_heap)
+            g = f - h
+            if g > g_score[current]:
+                continue  # Stale entry, a cheaper one was pushed later
+            if current == goal_index:
+                self.expanded = expanded
+                return self._reconstruct(current)
+            expanded += 1
+
+            row, col = divmod(current, cols)
+            g += 1  # Uniform cost between adjacent cells
+            # A step changes the Manhattan distance by exactly one, so h is updated, not recomputed
+            if row > 0:  # Up
+                neighbor = current - cols
+                if not blocked[neighbor] and (stamp[neighbor] != generation or g < g_score[neighbor]):
+                    stamp[neighbor] = generation
+                    g_score[neighbor] = g
+                    came_from[neighbor] = current
+                    n_h = h - 1 if goal_row < row else h + 1
+                    heapq.heappush(open_heap, (g + n_h, n_h, neighbor))
+            if current + cols < size:  # Down
+                neighbor = current + cols
+                if not blocked[neighbor] and (stamp[neighbor] != generation or g < g_score[neighbor]):
+                    stamp[neighbor] = generation
+                    g_score[neighbor] = g
+                    came_from[neighbor] = current
+                    n_h = h - 1 if goal_row > row else h + 1
+                    heapq.heappush(open_heap, (g + n_h, n_h, neighbor))
+            if col > 0:  # Left
+                neighbor = current - 1
+                if not blocked[neighbor] and (stamp[neighbor] != generation or g < g_score[neighbor]):
+                    stamp[neighbor] = generation
+                    g_score[neighbor] = g
+                    came_from[neighbor] = current
+                    n_h = h - 1 if goal_col < col else h + 1
+                    heapq.heappush(open_heap, (g + n_h, n_h, neighbor))
+            if col < cols - 1:  # Right
+                neighbor = current + 1
+                if not blocked[neighbor] and (stamp[neighbor] != generation or g < g_score[neighbor]):
+                    stamp[neighbor] = generation
+                    g_score[neighbor] = g
+                    came_from[neighbor] = current
+                    n_h = h - 1 if goal_col > col else h + 1
+                    heapq.heappush(open_heap, (g + n_h, n_h, neighbor))
+
+        self.expanded = expanded
+        return None
+
+    def search_events(self, start, goal):
+        """
+        The same search as find_path, run headless as an event stream for
+        visualisers: yields (OPENED, row, col) when a cell joins the open
+        list, (CLOSED, row, col) when it is expanded and finally
+        (PATH, row, col) for each cell of the route from start to goal.
+        The search knows nothing about drawing; consumers can buffer the
+        stream and replay it at whatever frame rate they like.
+        """
+        cols = self.cols
+        blocked, g_score, came_from, stamp = self.blocked, self.g_score, self.came_from, self.stamp
+        generation = self._next_generation()
+        start_index = start[0] * cols + start[1]
+        goal_index = goal[0] * cols + goal[1]
+        if blocked[start_index] or blocked[goal_index]:
+            return
+
+        g_score[start_index] = 0
+        came_from[start_index] = -1
+        stamp[start_index] = generation
+        start_h = abs(goal[0] - start[0]) + abs(goal[1] - start[1])
+        open_heap = [(start_h, start_h, start_index)]
+        yield OPENED, start[0], start[1]
+
+        while open_heap:
+            f, h, current = heapq.heappop(open_heap)
+            g = f - h
+            if g > g_score[current]:
+                continue
+            row, col = divmod(current, cols)
+            if current == goal_index:
+                for path_row, path_col in self._reconstruct(current):
+                    yield PATH, path_row, path_col
+                return
+            yield CLOSED, row, col
+
+            g += 1
+            for neighbor, n_row, n_col, inside in ((current - cols, row - 1, col, row > 0),
+                                                   (current + cols, row + 1, col, row < self.rows - 1),
+                                                   (current - 1, row, col - 1, col > 0),
+                                                   (current + 1, row, col + 1, col < cols - 1)):
+                if not inside or blocked[neighbor]:
+                    continue
+                if stamp[neighbor] != generation or g < g_score[neighbor]:
+                    stamp[neighbor] = generation
+                    g_score[neighbor] = g
+                    came_from[neighbor] = current
+                    n_h = abs(goal[0] - n_row) + abs(goal[1] - n_col)
+                    heapq.heappush(open_heap, (g + n_h, n_h, neighbor))
+                    yield OPENED, n_row, n_col
+
+    def _reconstruct(self, current):
+        cols = self.cols
+        path = []
+        while current != -1:
+            path.append(divmod(current, cols))
+            current = self.came_from[current]
+        path.reverse()
+        return path
@@ -0,0 +1,250 @@
+import heapq
+from collections import deque
+
+from grid_astar import GridAStar
+
+
+class HierarchicalPathfinder:
+    """
+    HPA* (hierarchical path-finding A*) over a GridAStar occupancy grid.
+
+    The map is cut into cluster_size x cluster_size clusters. Wherever two
+    neighbouring clusters share an open stretch of border we place
+    transitions (one in the middle of short openings, one at each end of
+    long ones). Inside each cluster the costs between its entrances are
+    precomputed, so a query only searches this small abstract graph and
+    then refines it into cells one segment at a time.
+
+    Walls must be changed through set_blocked, which rebuilds just the
+    cluster containing the cell and, if the cell sits on a cluster border,
+    the clusters across it.
+    """
+
+    def __init__(self, engine, cluster_size=16):
+        self.engine = engine  # Used for the low-level grid and to refine segments
+        self.rows, self.cols = engine.rows, engine.cols
+        self.cluster_size = cluster_size
+        self.cluster_rows = -(-self.rows // cluster_size)
+        self.cluster_cols = -(-self.cols // cluster_size)
+        self.transitions = {}  # (cluster, "right" | "down") -> [(cell, cell across the border)]
+        self.inter_edges = {}  # cell -> cells across a cluster border, cost 1
+        self.intra_edges = {}  # cluster -> {entrance: {entrance: cost inside the cluster}}
+
+        clusters = [(c_row, c_col) for c_row in range(self.cluster_rows) for c_col in range(self.cluster_cols)]
+        for cluster in clusters:
+            self._build_border(cluster, "right")
+            self._build_border(cluster, "down")
+        for cluster in clusters:
+            self._build_intra(cluster)
+
+    @classmethod
+    def from_layout(cls, layout, cluster_size=16):
+        return cls(GridAStar.from_layout(layout), cluster_size)
+
+    def _cluster_of(self, cell):
+        row, col = divmod(cell, self.cols)
+        return row // self.cluster_size, col // self.cluster_size
+
+    def _bounds(self, cluster):
+        size = self.cluster_size
+        top, left = cluster[0] * size, cluster[1] * size
+        return top, min(top + size, self.rows), left, min(left + size, self.cols)
+
+    def _build_border(self, cluster, side):
+        """(Re)place the transitions between cluster and its right or lower neighbour."""
+        for cell, across in self.transitions.pop((cluster, side), ()):
+            self.inter_edges[cell].discard(across)
+            self.inter_edges[across].discard(cell)
+
+        top, bottom, left, right = self._bounds(cluster)
+        cols = self.cols
+        if side == "right":
+            if right >= self.cols:
+                return
+            pairs = [(row * cols + right - 1, row * cols + right) for row in range(top, bottom)]
+        else:
+            if bottom >= self.rows:
+                return
+            pairs = [((bottom - 1) * cols + col, bottom * cols + col) for col in range(left, right)]
+
+        blocked = self.engine.blocked
+        transitions = []
+        run = []
+        for cell, across in pairs + [(None, None)]:
+            if cell is not None and not blocked[cell] and not blocked[across]:
+                run.append((cell, across))
+                continue
+            if len(run) >= 6:
+                transitions += [run[0], run[-1]]
+            elif run:
+                transitions.append(run[len(run) // 2])
+            run = []
+
+        self.transitions[(cluster, side)] = transitions
+        for cell, across in transitions:
+            self.inter_edges.setdefault(cell, set()).add(across)
+            self.inter_edges.setdefault(across, set()).add(cell)
+
+    def _entrances(self, cluster):
+        c_row, c_col = cluster
+        cells = set()
+        for key, index in (((cluster, "right"), 0), ((cluster, "down"), 0),
+                           (((c_row, c_col - 1), "right"), 1), (((c_row - 1, c_col), "down"), 1)):
+            cells.update(pair[index] for pair in self.transitions.get(key, ()))
+        return cells
+
+    def _cluster_bfs(self, cluster, source):
+        """Unit-cost distances from source to every open cell of its cluster, without leaving it."""
+        top, bottom, left, right = self._bounds(cluster)
+        cols = self.cols
+        blocked = self.engine.blocked
+        dist = {source: 0}
+        queue = deque([source])
+        while queue:
+            cell = queue.popleft()
+            row, col = divmod(cell, cols)
+            for neighbor, inside in ((cell - cols, row > top), (cell + cols, row < bottom - 1),
+                                     (cell - 1, col > left), (cell + 1, col < right - 1)):
+                if inside and not blocked[neighbor] and neighbor not in dist:
+                    dist[neighbor] = dist[cell] + 1
+                    queue.append(neighbor)
+        return dist
+
+    def _build_intra(self, cluster):
+        entrances = self._entrances(cluster)
+        edges = {}
+        for entrance in entrances:
+            dist = self._cluster_bfs(cluster, entrance)
+            edges[entrance] = {other: dist[other] for other in entrances if other != entrance and other in dist}
+        self.intra_edges[cluster] = edges
+
+    def set_blocked(self, row, col, blocked=True):
+        """Change one cell and rebuild only the clusters it can affect."""
+        if self.engine.is_blocked(row, col) == bool(blocked):
+            return
+        self.engine.set_blocked(row, col, blocked)
+        size = self.cluster_size
+        cluster = (row // size, col // size)
+        top, bottom, left, right = self._bounds(cluster)
+        rebuild = {cluster}
+
+        # Borders touching the cell: our own right/down ones, or the neighbour's facing us
+        for on_edge, border, other in (
+            (col == right - 1, (cluster, "right"), (cluster[0], cluster[1] + 1)),
+            (row == bottom - 1, (cluster, "down"), (cluster[0] + 1, cluster[1])),
+            (col == left, ((cluster[0], cluster[1] - 1), "right"), (cluster[0], cluster[1] - 1)),
+            (row == top, ((cluster[0] - 1, cluster[1]), "down"), (cluster[0] - 1, cluster[1])),
+        ):
+            if on_edge and 0 <= other[0] < self.cluster_rows and 0 <= other[1] < self.cluster_cols:
+                self._build_border(*border)
+                rebuild.add(other)
+        for affected in rebuild:
+            self._build_intra(affected)
+
+    def abstract_path(self, start, goal):
+        """Cheapest route over the abstract graph as a list of cell indices, or None."""
+        cols = self.cols
+        source, target = start[0] * cols + start[1], goal[0] * cols + goal[1]
+        blocked = self.engine.blocked
+        if blocked[source] or blocked[target]:
+            return None
+        if source == target:
+            return [source]
+
+        # Temporarily link start and goal to the entrances of their clusters
+        source_cluster, target_cluster = self._cluster_of(source), self._cluster_of(target)
+        source_dist = self._cluster_bfs(source_cluster, source)
+        start_edges = {cell: source_dist[cell] for cell in self._entrances(source_cluster) if cell in source_dist}
+        if source_cluster == target_cluster and target in source_dist:
+            start_edges[target] = source_dist[target]
+        target_dist = self._cluster_bfs(target_cluster, target)
+        goal_edges = {cell: target_dist[cell] for cell in self._entrances(target_cluster) if cell in target_dist}
+
+        goal_row, goal_col = goal
+        g_score = {source: 0}
+        came_from = {source: None}
+        closed = set()
+        open_heap = [(0, source)]
+        while open_heap:
+            _, node = heapq.heappop(open_heap)
+            if node in closed:
+                continue
+            if node == target:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = came_from[node]
+                path.reverse()
+                return path
+            closed.add(node)
+
+            edges = start_edges if node == source else self.intra_edges[self._cluster_of(node)].get(node, {})
+            neighbors = list(edges.items())
+            neighbors += [(across, 1) for across in self.inter_edges.get(node, ())]
+            if node in goal_edges:
+                neighbors.append((target, goal_edges[node]))
+            for neighbor, cost in neighbors:
+                new_g = g_score[node] + cost
+                if new_g < g_score.get(neighbor, float("inf")):
+                    g_score[neighbor] = new_g
+                    came_from[neighbor] = node
+                    row, col = divmod(neighbor, cols)
+                    heapq.heappush(open_heap, (new_g + abs(goal_row - row) + abs(goal_col - col), neighbor))
+        return None
+
+    def iter_path(self, start, goal):
+        """Yield the (row, col) cells of the route, refining one abstract edge at a time."""
+        abstract = self.abstract_path(start, goal)
+        if abstract is None:
+            return
+        cols = self.cols
+        yield divmod(abstract[0], cols)
+        for cell, next_cell in zip(abstract, abstract[1:]):
+            segment = self.engine.find_path(divmod(cell, cols), divmod(next_cell, cols))
+            yield from segment[1:]
+
+    def find_path(self, start, goal):
+        """Same contract as GridAStar.find_path, but routes through the cluster graph."""
+        path = []
+        position = {}
+        for cell in self.iter_path(start, goal):
+            if cell in position:
+                # Refined segments can double back through an entrance: cut the loop out
+                cut = position[cell]
+                for looped in path[cut + 1:]:
+                    del position[looped]
+                del path[cut + 1:]
+                continue
+            position[cell] = len(path)
+            path.append(cell)
+        return path or None
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    rng = random.Random(7)
+    size = 512
+    layout = [["#" if rng.random() < 0.25 else "." for _ in range(size)] for _ in range(size)]
+    flat = GridAStar.from_layout(layout)
+
+    start_time = time.perf_counter()
+    hierarchy = HierarchicalPathfinder(GridAStar.from_layout(layout), cluster_size=16)
+    print(f"Preprocessed {size}x{size} map in {time.perf_counter() - start_time:.2f} s")
+
+    flat_time = hpa_time = 0.0
+    flat_length = hpa_length = 0
+    for _ in range(20):
+        start, goal = (rng.randrange(size), rng.randrange(size)), (rng.randrange(size), rng.randrange(size))
+        t = time.perf_counter()
+        exact = flat.find_path(start, goal)
+        flat_time += time.perf_counter() - t
+        t = time.perf_counter()
+        route = hierarchy.find_path(start, goal)
+        hpa_time += time.perf_counter() - t
+        if exact and route:
+            flat_length += len(exact) - 1
+            hpa_length += len(route) - 1
+    print(f"Flat A*: {1000 * flat_time / 20:.1f} ms/query, HPA*: {1000 * hpa_time / 20:.1f} ms/query, "
+          f"path overhead {100 * (hpa_length / flat_length - 1):.1f}%")
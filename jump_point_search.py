@@ -0,0 +1,225 @@
+import heapq
+import math
+from array import array
+
+from grid_astar import GridAStar
+
+SQRT2 = math.sqrt(2)
+
+
+class JumpPointSearch(GridAStar):
+    """
+    Jump Point Search on a uniform-cost occupancy grid.
+
+    Instead of pushing every neighbour, JPS scans in straight lines (and
+    diagonals when diagonal=True) and only stops at "jump points": the goal
+    or cells with a forced neighbour that a symmetric path could not reach
+    as cheaply. On open terrain this skips almost all of the equivalent
+    paths plain A* expands. Diagonal moves never cut a wall corner.
+
+    Fewer expansions is not the same as faster: each jump scans its line a
+    cell at a time in Python, so 4-connected JPS is several times slower
+    than GridAStar on open maps and only about level with it on mazes,
+    where expansions dominate (see bench_jump_point_search.py).
+
+    Scans run on a copy of the grid framed by a one-cell wall border, so
+    they need no bounds checks. Change cells through set_blocked to keep
+    that copy in sync. Paths are returned cell by cell, like GridAStar.
+    """
+
+    def __init__(self, rows, cols, blocked=None, diagonal=False):
+        super().__init__(rows, cols, blocked)
+        self.diagonal = diagonal
+        self.width = cols + 2
+        self.walls = bytearray(b'\x01' * ((rows + 2) * self.width))
+        for row in range(rows):
+            start = (row + 1) * self.width + 1
+            self.walls[start:start + cols] = self.blocked[row * cols:(row + 1) * cols]
+
+        # Search state is indexed by padded cell, diagonal steps make g-scores fractional
+        size = len(self.walls)
+        self.g_score = array('d', bytes(8 * size))
+        self.came_from = array('i', bytes(4 * size))
+        self.stamp = array('I', bytes(4 * size))
+        self.closed = array('I', bytes(4 * size))
+
+    def set_blocked(self, row, col, blocked=True):
+        super().set_blocked(row, col, blocked)
+        self.walls[(row + 1) * self.width + col + 1] = blocked
+
+    def _next_generation(self):
+        if self.generation == 0xFFFFFFFF:
+            self.closed = array('I', bytes(4 * len(self.walls)))
+            self.stamp = array('I', bytes(4 * len(self.walls)))
+            self.generation = 0
+        self.generation += 1
+        return self.generation
+
+    def _jump_straight(self, cell, d_row, d_col, goal):
+        """Scan from cell in a straight line; return the first jump point or -1."""
+        walls = self.walls
+        width = self.width
+        if d_col:
+            while True:
+                if walls[cell]:
+                    return -1
+                if cell == goal:
+                    return cell
+                # A side cell that opens up where the one behind it was blocked is a forced neighbour
+                if (not walls[cell - width] and walls[cell - width - d_col]) or \
+                        (not walls[cell + width] and walls[cell + width - d_col]):
+                    return cell
+                cell += d_col
+
+        step = d_row * width
+        while True:
+            if walls[cell]:
+                return -1
+            if cell == goal:
+                return cell
+            if (not walls[cell - 1] and walls[cell - 1 - step]) or \
+                    (not walls[cell + 1] and walls[cell + 1 - step]):
+                return cell
+            # 4-connected: a vertical scan stops where a horizontal scan would find something
+            if not self.diagonal and (self._jump_straight(cell + 1, 0, 1, goal) >= 0 or
+                                      self._jump_straight(cell - 1, 0, -1, goal) >= 0):
+                return cell
+            cell += step
+
+    def _jump_diagonal(self, cell, d_row, d_col, goal):
+        walls = self.walls
+        vertical = d_row * self.width
+        while True:
+            if walls[cell]:
+                return -1
+            if cell == goal:
+                return cell
+            if self._jump_straight(cell + vertical, d_row, 0, goal) >= 0 or \
+                    self._jump_straight(cell + d_col, 0, d_col, goal) >= 0:
+                return cell
+            # No corner cutting: both orthogonal cells must be open to continue diagonally
+            if walls[cell + vertical] or walls[cell + d_col]:
+                return -1
+            cell += vertical + d_col
+
+    def _directions(self, cell, parent):
+        """Pruned set of (d_row, d_col) to scan from a jump point reached from parent."""
+        walls = self.walls
+        width = self.width
+        if parent == -1:
+            directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+            if self.diagonal:
+                directions += [(d_row, d_col) for d_row in (-1, 1) for d_col in (-1, 1)
+                               if not walls[cell + d_row * width] and not walls[cell + d_col]]
+            return directions
+
+        row, col = divmod(cell, width)
+        p_row, p_col = divmod(parent, width)
+        d_row = (row > p_row) - (row < p_row)
+        d_col = (col > p_col) - (col < p_col)
+        if not self.diagonal:
+            if d_col:
+                return [(-1, 0), (1, 0), (0, d_col)]
+            return [(0, -1), (0, 1), (d_row, 0)]
+
+        if d_row and d_col:
+            directions = [(d_row, 0), (0, d_col)]
+            if not walls[cell + d_row * width] and not walls[cell + d_col]:
+                directions.append((d_row, d_col))
+            return directions
+        if d_col:
+            directions = [(0, d_col), (-1, 0), (1, 0)]
+            if not walls[cell + d_col]:
+                directions += [(side, d_col) for side in (-1, 1) if not walls[cell + side * width]]
+            return directions
+        directions = [(d_row, 0), (0, -1), (0, 1)]
+        if not walls[cell + d_row * width]:
+            directions += [(d_row, side) for side in (-1, 1) if not walls[cell + side]]
+        return directions
+
+    def _heuristic(self, cell, goal_row, goal_col):
+        row, col = divmod(cell, self.width)
+        d_row, d_col = abs(goal_row - row), abs(goal_col - col)
+        if self.diagonal:
+            return max(d_row, d_col) + (SQRT2 - 1) * min(d_row, d_col)  # Octile distance
+        return d_row + d_col
+
+    def find_path(self, start, goal):
+        """Same contract as GridAStar.find_path; diagonal steps appear when diagonal=True."""
+        width = self.width
+        walls = self.walls
+        g_score, came_from, stamp, closed = self.g_score, self.came_from, self.stamp, self.closed
+        generation = self._next_generation()
+
+        start_cell = (start[0] + 1) * width + start[1] + 1
+        goal_cell = (goal[0] + 1) * width + goal[1] + 1
+        goal_row, goal_col = goal[0] + 1, goal[1] + 1
+        if walls[start_cell] or walls[goal_cell]:
+            return None
+
+        g_score[start_cell] = 0
+        came_from[start_cell] = -1
+        stamp[start_cell] = generation
+        open_heap = [(self._heuristic(start_cell, goal_row, goal_col), start_cell)]
+        expanded = 0
+
+        while open_heap:
+            _, current = heapq.heappop(open_heap)
+            if closed[current] == generation:
+                continue
+            closed[current] = generation
+            if current == goal_cell:
+                self.expanded = expanded
+                return self._reconstruct(current)
+            expanded += 1
+
+            row, col = divmod(current, width)
+            for d_row, d_col in self._directions(current, came_from[current]):
+                first = current + d_row * width + d_col
+                if d_row and d_col:
+                    jump = self._jump_diagonal(first, d_row, d_col, goal_cell)
+                else:
+                    jump = self._jump_straight(first, d_row, d_col, goal_cell)
+                if jump < 0 or closed[jump] == generation:
+                    continue
+                j_row, j_col = divmod(jump, width)
+                steps_row, steps_col = abs(j_row - row), abs(j_col - col)
+                new_g = g_score[current] + (SQRT2 * steps_row if steps_row and steps_col else steps_row + steps_col)
+                if stamp[jump] != generation or new_g < g_score[jump]:
+                    stamp[jump] = generation
+                    g_score[jump] = new_g
+                    came_from[jump] = current
+                    heapq.heappush(open_heap, (new_g + self._heuristic(jump, goal_row, goal_col), jump))
+
+        self.expanded = expanded
+        return None
+
+    def _reconstruct(self, current):
+        jump_points = []
+        while current != -1:
+            row, col = divmod(current, self.width)
+            jump_points.append((row - 1, col - 1))
+            current = self.came_from[current]
+        jump_points.reverse()
+
+        # Fill in the cells between consecutive jump points
+        path = [jump_points[0]]
+        for row, col in jump_points[1:]:
+            p_row, p_col = path[-1]
+            d_row = (row > p_row) - (row < p_row)
+            d_col = (col > p_col) - (col < p_col)
+            while (p_row, p_col) != (row, col):
+                p_row += d_row
+                p_col += d_col
+                path.append((p_row, p_col))
+        return path
+
+
+def jump_point_search(grid, start, end, diagonal=False):
+    """
+    Drop-in for the Node-based grids: grid of Node objects (walls "#" or
+    is_barrier()), start/end Node objects. Returns a reconstruct_path style
+    list of (row, col), or None if there is no path.
+    """
+    engine = JumpPointSearch.from_grid(grid, diagonal=diagonal)
+    return engine.find_path(start.get_pos(), end.get_pos())
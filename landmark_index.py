@@ -0,0 +1,173 @@
+import heapq
+import mmap
+import struct
+from array import array
+
+from dijkstra_Weighted_Graph import WeightedGraph, dijkstra_csr
+
+# File layout: header, landmark node ids ('q'), then one row of distances ('d') per landmark
+_HEADER = struct.Struct('<8sqqq')  # magic, node_count, edge_count, landmark_count
+_MAGIC = b'ALTINDEX'
+
+
+class LandmarkIndex:
+    """
+    ALT (A*, Landmarks, Triangle inequality) preprocessing for a WeightedGraph.
+    For a handful of landmarks L we store the exact cost d(L, v) to every node,
+    so |d(L, t) - d(L, v)| is a lower bound on the cost from v to t. A* with
+    that bound only expands the nodes close to the cheapest route.
+
+    The index is only valid for the graph it was built from: rebuild it after
+    create_connection, since a cheaper edge can break the lower bounds.
+    """
+
+    def __init__(self, landmarks, distances, node_count, edge_count, mapping=None):
+        self.landmarks = landmarks
+        self.distances = distances  # Flat, row l holds d(landmarks[l], v) at [l * node_count + v]
+        self.node_count = node_count
+        self.edge_count = edge_count
+        self._mapping = mapping  # Open mmap when loaded from disk
+
+    @classmethod
+    def build(cls, graph, landmark_count=8):
+        """
+        Pick landmarks by farthest-point selection (each new landmark is the
+        node furthest from the ones already chosen) and run one full Dijkstra
+        per landmark: O(L (V + E) log V) preprocessing, O(L V) storage.
+        """
+        offsets, targets, weights = graph.to_csr()
+        node_count = graph.node_count
+        landmarks = array('q')
+        distances = array('d')
+        closest = [float('inf')] * node_count  # Cost from each node to its nearest landmark
+        candidate = 0
+
+        for _ in range(min(landmark_count, node_count)):
+            row = dijkstra_csr(offsets, targets, weights, candidate, node_count)
+            landmarks.append(candidate)
+            distances.extend(row)
+            closest = [min(a, b) for a, b in zip(closest, row)]
+
+            # Jump to a component no landmark reaches yet, else take the furthest node
+            candidate = next((node for node, cost in enumerate(closest) if cost == float('inf')), None)
+            if candidate is None:
+                candidate = max(range(node_count), key=closest.__getitem__)
+                if closest[candidate] == 0:
+                    break  # Every node is already a landmark
+
+        return cls(landmarks, distances, node_count, len(targets))
+
+    def save(self, path):
+        with open(path, 'wb') as file:
+            file.write(_HEADER.pack(_MAGIC, self.node_count, self.edge_count, len(self.landmarks)))
+            file.write(memoryview(array('q', self.landmarks)).cast('B'))
+            file.write(memoryview(array('d', self.distances)).cast('B'))
+
+    @classmethod
+    def load(cls, path):
+        """Memory-map a saved index: nothing is copied, pages are shared between processes."""
+        with open(path, 'rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, node_count, edge_count, landmark_count = _HEADER.unpack_from(mapping)
+        if magic != _MAGIC:
+            mapping.close()
+            raise ValueError(f"{path} is not a landmark index file")
+        view = memoryview(mapping)
+        start = _HEADER.size
+        landmarks = view[start:start + 8 * landmark_count].cast('q')
+        start += 8 * landmark_count
+        distances = view[start:start + 8 * landmark_count * node_count].cast('d')
+        return cls(landmarks, distances, node_count, edge_count, mapping)
+
+    def close(self):
+        if self._mapping is not None:
+            self.landmarks.release()
+            self.distances.release()
+            self._mapping.close()
+            self._mapping = None
+
+    def _check_graph(self, graph):
+        if graph.node_count != self.node_count or len(graph.to_csr()[1]) != self.edge_count:
+            raise ValueError("Landmark index was built for a different graph, rebuild it")
+
+    def shortest_path(self, graph, src_label, dst_label, active_landmarks=4):
+        """
+        A* query guided by the landmark lower bounds.
+        Only the active_landmarks giving the tightest bound for this
+        source/target pair are used, which keeps the heuristic cheap.
+        Returns (cost, [labels along the route]), or (inf, []) if unreachable.
+        """
+        self._check_graph(graph)
+        offsets, targets, weights = graph.to_csr()
+        source = graph.node_index(src_label)
+        target = graph.node_index(dst_label)
+        node_count = self.node_count
+        distances = self.distances
+        inf = float('inf')
+
+        # Landmarks that don't reach the target carry no information about it
+        rows = []
+        for l in range(len(self.landmarks)):
+            base = l * node_count
+            to_target, to_source = distances[base + target], distances[base + source]
+            if to_target != inf and to_source != inf:
+                rows.append((abs(to_target - to_source), base, to_target))
+            elif to_target != to_source:
+                return inf, []  # Source and target are in different components
+        rows.sort(reverse=True)
+        rows = [(base, to_target) for _, base, to_target in rows[:active_landmarks]]
+
+        def lower_bound(node):
+            best = 0
+            for base, to_target in rows:
+                bound = abs(to_target - distances[base + node])
+                if bound > best:
+                    best = bound
+            return best
+
+        path_costs = {source: 0}
+        previous = {source: None}
+        settled = set()
+        heap = [(lower_bound(source), 0, source)]
+        while heap:
+            _, cost, node = heapq.heappop(heap)
+            if node in settled:
+                continue
+            if node == target:
+                route = []
+                while node is not None:
+                    route.append(graph.node_labels[node])
+                    node = previous[node]
+                route.reverse()
+                return cost, route
+            settled.add(node)
+            for edge in range(offsets[node], offsets[node + 1]):
+                neighbor = targets[edge]
+                new_cost = cost + weights[edge]
+                if new_cost < path_costs.get(neighbor, inf):
+                    path_costs[neighbor] = new_cost
+                    previous[neighbor] = node
+                    heapq.heappush(heap, (new_cost + lower_bound(neighbor), new_cost, neighbor))
+
+        return inf, []
+
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    network = WeightedGraph(7, storage="csr")
+    for node, label in enumerate(['Central', 'North', 'East', 'West', 'South', 'Airport', 'Harbor']):
+        network.assign_label(node, label)
+    for node1, node2, cost in [(3, 0, 4), (3, 4, 2), (0, 2, 3), (0, 4, 4), (2, 4, 4),
+                               (4, 6, 5), (2, 5, 5), (2, 1, 2), (1, 5, 2), (6, 5, 5)]:
+        network.create_connection(node1, node2, cost)
+
+    # Preprocess offline, then map the saved table back in as a query process would
+    with tempfile.TemporaryDirectory() as directory:
+        index_path = os.path.join(directory, 'transport.alt')
+        LandmarkIndex.build(network, landmark_count=3).save(index_path)
+        index = LandmarkIndex.load(index_path)
+        cost, route = index.shortest_path(network, 'West', 'Airport')
+        print(f"Fastest route West -> Airport ({cost:g} mins): {' -> '.join(route)}")
+        index.close()
@@ -0,0 +1,302 @@
+"""
+Monte Carlo Tree Search for m,n,k-games (k in a row on a rows x cols board).
+
+    python mcts.py --size 9 --k 5 --budget-ms 500 --workers 4
+
+Same rules as brute_force.py (winning_lines, open_positions), but searched
+by random playouts under a time budget instead of exhaustively, so it
+scales to 9x9 and 15x15 boards. ParallelMCTS runs one tree per worker
+process (root parallelisation) and adds up their root statistics; every
+tree keeps the subtree of the move actually played between turns.
+"""
+import math
+import multiprocessing
+import os
+import random
+import time
+
+from brute_force import find_winner, open_positions, winning_lines
+
+EXPLORATION = 1.4
+
+
+class Node:
+    __slots__ = ("move", "parent", "children", "untried", "visits", "wins")
+
+    def __init__(self, move, parent, untried):
+        self.move = move
+        self.parent = parent
+        self.children = {}  # move -> Node
+        self.untried = untried  # Candidate moves not expanded yet, popped from the end
+        self.visits = 0
+        self.wins = 0.0  # For the player who made self.move; draws count half
+
+
+class MCTS:
+    """
+    One search tree over a position that advances as moves are played.
+
+    Positions are two bitboards (X's and O's stones) and a win is a mask
+    test against the lines through the cell just played, so playouts never
+    rescan the board. The tree only branches on empty cells within radius
+    of a stone, which is where k-in-a-row games are decided.
+    """
+
+    def __init__(self, rows, cols, k, seed=None, radius=2):
+        self.rows, self.cols, self.k = rows, cols, k
+        self.cells = rows * cols
+        self.rng = random.Random(seed)
+        masks = [sum(1 << cell for cell in line) for line in winning_lines(rows, cols, k)]
+        self.lines_through = [[mask for mask in masks if mask >> cell & 1] for cell in range(self.cells)]
+        self.neighborhood = []  # cell -> mask of the cells within radius of it
+        for cell in range(self.cells):
+            row, col = divmod(cell, cols)
+            self.neighborhood.append(sum(1 << (r * cols + c)
+                                         for r in range(max(0, row - radius), min(rows, row + radius + 1))
+                                         for c in range(max(0, col - radius), min(cols, col + radius + 1))))
+        self.stones = [0, 0]  # X, O
+        self.to_move = 0
+        self.winner = None  # 0 or 1 once someone has k in a row
+        self.near = 0  # Mask of empty cells within radius of any stone
+        self.root = Node(None, None, self._candidates(self.stones, self.near))
+        self.playouts = 0  # Playouts run by the last search
+
+    def _wins(self, stones, cell):
+        for line in self.lines_through[cell]:
+            if stones & line == line:
+                return True
+        return False
+
+    def _candidates(self, stones, near):
+        occupied = stones[0] | stones[1]
+        if not occupied:
+            return [self.cells // 2]
+        moves = [cell for cell in range(self.cells) if near >> cell & 1 and not occupied >> cell & 1]
+        if not moves:
+            moves = [cell for cell in range(self.cells) if not occupied >> cell & 1]
+        self.rng.shuffle(moves)
+        return moves
+
+    def play(self, move):
+        """Play move on the tree's position, keeping the matching subtree if it was searched."""
+        bit = 1 << move
+        if (self.stones[0] | self.stones[1]) & bit:
+            raise ValueError(f"Cell {move} is already taken")
+        self.stones[self.to_move] |= bit
+        self.near = (self.near | self.neighborhood[move]) & ~(self.stones[0] | self.stones[1])
+        if self._wins(self.stones[self.to_move], move):
+            self.winner = self.to_move
+        self.to_move ^= 1
+
+        child = self.root.children.get(move)
+        if child is None:
+            child = Node(move, None, self._candidates(self.stones, self.near))
+        child.parent = None
+        self.root = child
+
+    def _playout(self, stones, to_move, empty):
+        """Finish the game with random moves; returns the winner (0, 1) or None for a draw."""
+        self.rng.shuffle(empty)
+        stones = stones[:]
+        for cell in empty:
+            stones[to_move] |= 1 << cell
+            if self._wins(stones[to_move], cell):
+                return to_move
+            to_move ^= 1
+        return None
+
+    def search(self, budget_ms=None, iterations=None):
+        """Grow the tree until the time budget or iteration count runs out."""
+        deadline = time.perf_counter() + budget_ms / 1000 if budget_ms is not None else None
+        done = 0
+        while (iterations is None or done < iterations) and (deadline is None or time.perf_counter() < deadline):
+            self._iterate()
+            done += 1
+        self.playouts = done
+        return done
+
+    def _iterate(self):
+        if self.winner is not None:
+            return
+        node = self.root
+        stones = self.stones[:]
+        near = self.near
+        to_move = self.to_move
+        winner = None
+        finished = False
+
+        # Selection: UCT down through fully expanded nodes
+        while not node.untried and node.children:
+            log_visits = math.log(node.visits)
+            best, best_value = None, -1.0
+            for child in node.children.values():
+                value = child.wins / child.visits + EXPLORATION * math.sqrt(log_visits / child.visits)
+                if value > best_value:
+                    best, best_value = child, value
+            node = best
+            stones[to_move] |= 1 << node.move
+            near = (near | self.neighborhood[node.move]) & ~(stones[0] | stones[1])
+            if self._wins(stones[to_move], node.move):
+                winner, finished = to_move, True
+                to_move ^= 1
+                break
+            to_move ^= 1
+        else:
+            # Expansion
+            if node.untried:
+                move = node.untried.pop()
+                stones[to_move] |= 1 << move
+                near = (near | self.neighborhood[move]) & ~(stones[0] | stones[1])
+                child = Node(move, node, None)
+                if self._wins(stones[to_move], move):
+                    winner, finished = to_move, True
+                    child.untried = []
+                else:
+                    child.untried = self._candidates(stones, near)
+                node.children[move] = child
+                node = child
+                to_move ^= 1
+            else:
+                finished = True  # Board full: draw
+
+        # Simulation
+        if not finished:
+            occupied = stones[0] | stones[1]
+            empty = [cell for cell in range(self.cells) if not occupied >> cell & 1]
+            winner = self._playout(stones, to_move, empty)
+
+        # Backpropagation: each node is scored for the player who moved into it
+        mover = to_move ^ 1
+        while node is not None:
+            node.visits += 1
+            if winner is None:
+                node.wins += 0.5
+            elif winner == mover:
+                node.wins += 1
+            node = node.parent
+            mover ^= 1
+
+    def root_stats(self):
+        """{move: (visits, wins)} for the moves searched from the current position."""
+        return {move: (child.visits, child.wins) for move, child in self.root.children.items()}
+
+
+def _search_worker(connection, rows, cols, k, seed):
+    tree = MCTS(rows, cols, k, seed)
+    while True:
+        request = connection.recv()
+        if request is None:
+            break
+        moves, budget_ms = request
+        for move in moves:
+            tree.play(move)
+        tree.search(budget_ms)
+        connection.send((tree.root_stats(), tree.playouts))
+
+
+class ParallelMCTS:
+    """
+    Root-parallel MCTS: each worker process grows its own tree from the same
+    position with a different seed for budget_ms, and the root visit counts
+    are summed before picking the most visited move. Workers keep their
+    trees between calls and are only sent the moves played since, so the
+    subtree below the played moves is reused.
+
+    workers=1 searches in this process. Use as a context manager, or call close().
+    """
+
+    def __init__(self, rows, cols, k, workers=None, seed=0):
+        self.rows, self.cols, self.k = rows, cols, k
+        self.board = [" "] * (rows * cols)
+        self.pending = []  # Moves played since the workers last heard from us
+        self.playouts = 0  # Across all workers for the last move
+        self.workers = workers or os.cpu_count() or 1
+        self.connections = []
+        self.processes = []
+        if self.workers == 1:
+            self.tree = MCTS(rows, cols, k, seed)
+            return
+        for worker in range(self.workers):
+            parent_end, child_end = multiprocessing.Pipe()
+            process = multiprocessing.Process(target=_search_worker, args=(child_end, rows, cols, k, seed + worker),
+                                              daemon=True)
+            process.start()
+            self.connections.append(parent_end)
+            self.processes.append(process)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for connection in self.connections:
+            connection.send(None)
+        for process in self.processes:
+            process.join()
+        self.connections, self.processes = [], []
+
+    def play(self, move):
+        if self.board[move] != " ":
+            raise ValueError(f"Cell {move} is already taken")
+        self.board[move] = "X" if self.board.count("X") == self.board.count("O") else "O"
+        self.pending.append(move)
+
+    def best_move(self, budget_ms):
+        """
+        Most visited move for the side to play, after searching for budget_ms
+        on every worker; None once the game is decided or the board is full.
+        """
+        if " " not in self.board or find_winner(self.board, self.rows, self.cols, self.k):
+            return None
+        if self.workers == 1:
+            for move in self.pending:
+                self.tree.play(move)
+            self.tree.search(budget_ms)
+            results = [(self.tree.root_stats(), self.tree.playouts)]
+        else:
+            for connection in self.connections:
+                connection.send((self.pending, budget_ms))
+            results = [connection.recv() for connection in self.connections]
+        self.pending = []
+
+        totals = {}
+        self.playouts = 0
+        for stats, playouts in results:
+            self.playouts += playouts
+            for move, (visits, _) in stats.items():
+                totals[move] = totals.get(move, 0) + visits
+        if not totals:
+            return open_positions(self.board)[0]
+        return max(totals, key=totals.get)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=9)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--budget-ms", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=None, help="default: one per CPU")
+    args = parser.parse_args()
+
+    # Self-play: the parallel engine as X against a single-process engine as O
+    size = args.size
+    with ParallelMCTS(size, size, args.k, workers=args.workers, seed=1) as x_engine, \
+            ParallelMCTS(size, size, args.k, workers=1, seed=2) as o_engine:
+        winner = None
+        for turn in range(size * size):
+            engine = x_engine if turn % 2 == 0 else o_engine
+            move = engine.best_move(args.budget_ms)
+            x_engine.play(move)
+            o_engine.play(move)
+            print(f"{'XO'[turn % 2]} plays {divmod(move, size)} after {engine.playouts} playouts")
+            winner = find_winner(x_engine.board, size, size, args.k)
+            if winner:
+                break
+        for row in range(size):
+            print(" ".join(cell if cell != " " else "." for cell in x_engine.board[row * size:(row + 1) * size]))
+        print(f"Winner: {winner or 'draw'}")
+        assert x_engine.best_move(args.budget_ms) is None, "no move once the game is over"
@@ -0,0 +1,93 @@
+from collections import OrderedDict
+
+_MISSING = object()
+
+
+class PathCache:
+    """
+    LRU cache in front of a grid path search, keyed on (start, goal, map_version).
+
+    search: callable(start, goal) returning a list of (row, col) or None,
+            e.g. GridAStar(...).find_path.
+    max_cells: memory budget, counted in stored path cells; the least
+               recently used paths are evicted to stay under it.
+
+    When a cell turns into a wall, call cell_blocked: only the cached paths
+    that run through that cell are dropped (the rest are still shortest,
+    a new wall can only make other routes longer). Anything that can open up
+    a shorter route, such as clearing a wall, goes through map_changed, which
+    starts a new map version.
+    """
+
+    def __init__(self, search, max_cells=1_000_000):
+        self.search = search
+        self.max_cells = max_cells
+        self.map_version = 0
+        self.entries = OrderedDict()  # key -> tuple of cells, or None if there is no path
+        self.paths_through = {}  # cell -> keys of the cached paths that use it
+        self.cached_cells = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+
+    def find_path(self, start, goal):
+        key = (tuple(start), tuple(goal), self.map_version)
+        path = self.entries.get(key, _MISSING)
+        if path is not _MISSING:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return None if path is None else list(path)
+
+        self.misses += 1
+        path = self.search(start, goal)
+        self._store(key, None if path is None else tuple(path))
+        return path
+
+    def cell_blocked(self, cell):
+        """A cell became a wall: drop just the cached paths running through it."""
+        for key in self.paths_through.pop(tuple(cell), ()):
+            if key in self.entries:
+                self._remove(key, skip_cell=tuple(cell))
+                self.invalidated += 1
+
+    def map_changed(self):
+        """Walls were cleared or the map was replaced: every cached answer may be stale."""
+        self.map_version += 1
+        self.invalidated += len(self.entries)
+        self.entries.clear()
+        self.paths_through.clear()
+        self.cached_cells = 0
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "invalidated": self.invalidated,
+            "entries": len(self.entries),
+            "cached_cells": self.cached_cells,
+        }
+
+    def _store(self, key, path):
+        size = len(path) if path else 1
+        if size > self.max_cells:
+            return  # Would evict everything else and still not fit
+        self.entries[key] = path
+        self.cached_cells += size
+        for cell in path or ():
+            self.paths_through.setdefault(cell, set()).add(key)
+        while self.cached_cells > self.max_cells:
+            self._remove(next(iter(self.entries)))
+
+    def _remove(self, key, skip_cell=None):
+        path = self.entries.pop(key)
+        self.cached_cells -= len(path) if path else 1
+        for cell in path or ():
+            if cell == skip_cell:
+                continue
+            keys = self.paths_through.get(cell)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.paths_through[cell]
@@ -0,0 +1,351 @@
+"""
+Asyncio query service for the search routines, speaking JSON lines over TCP or a Unix socket.
+
+    python path_service.py --port 8765 --workers 4
+    python path_service.py --unix /tmp/paths.sock --graph roads.wgraph --grid level.txt
+
+One JSON object per line in, one per line out, matched by "id" (answers
+come back in completion order):
+
+    {"id": 1, "op": "grid_path", "start": [0, 0], "goal": [40, 17]}
+    {"id": 2, "op": "distances", "source": "12", "targets": ["40", "977"]}
+    {"id": 3, "op": "best_move", "board": "XO  X    ", "player": "O"}
+    {"id": 4, "op": "stats"}
+
+-> {"id": 1, "result": [[0, 0], [1, 0], ...]}  or  {"id": 1, "error": "..."}
+
+Searches run in a process pool whose workers all map the same graph file
+(WeightedGraph.load). Identical queries in flight at the same time share
+one computation, and distance queries from the same source that arrive
+within --batch-ms of each other share one Dijkstra run. Queues are
+bounded, so when the pool falls behind the service stops reading from
+sockets instead of buffering without limit.
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from brute_force import MNKSolver
+from dijkstra_Weighted_Graph import WeightedGraph, dijkstra_csr, road_network
+from grid_astar import GridAStar
+
+MAX_SOLVER_CELLS = 16  # Largest best_move board; 4x4 solves in seconds, 5x5 takes minutes
+
+# Per-worker search engines, built once by the pool initializer
+_engines = None
+
+
+def random_layout(size, seed, wall_fraction=0.25):
+    """size x size layout of "." and "#" cells; the load generator rebuilds it to pick open cells."""
+    rng = random.Random(seed)
+    return ["".join("#" if rng.random() < wall_fraction else "." for _ in range(size)) for _ in range(size)]
+
+
+def grid_layout(grid_path=None, grid_size=256, grid_seed=0):
+    """Rows of a layout file ("#" walls, anything else open, one row per line), or random_layout without one."""
+    if grid_path is None:
+        return random_layout(grid_size, grid_seed)
+    with open(grid_path, encoding="utf-8") as file:
+        layout = [line.rstrip("\r\n") for line in file if line.strip()]
+    if not layout or len({len(row) for row in layout}) != 1:
+        raise ValueError(f"{grid_path} needs one or more rows of equal length")
+    return layout
+
+
+def _start_worker(grid_size, grid_seed, graph_path, grid_path=None):
+    global _engines
+    _engines = {
+        "grid": GridAStar.from_layout(grid_layout(grid_path, grid_size, grid_seed)),
+        "graph": WeightedGraph.load(graph_path),
+        "solvers": {},  # (rows, cols, k) -> MNKSolver, keeping its tables between queries
+    }
+
+
+def _grid_path(start, goal):
+    grid = _engines["grid"]
+    for row, col in (start, goal):
+        if not (0 <= row < grid.rows and 0 <= col < grid.cols):
+            raise ValueError(f"Cell {[row, col]} is off the {grid.rows}x{grid.cols} grid")
+    path = grid.find_path(start, goal)
+    return None if path is None else [list(cell) for cell in path]
+
+
+def _distances(source, targets):
+    """
+    {label: cost} from source to targets (every node when targets is None).
+    Unknown targets are left out here, so one bad label can't fail a whole
+    batch; PathService._split_distances turns them into errors per query.
+    """
+    graph = _engines["graph"]
+    offsets, targets_csr, weights = graph.to_csr()
+    source_node = graph.node_index(source)
+    if targets is None:
+        costs = dijkstra_csr(offsets, targets_csr, weights, source_node, graph.node_count)
+        return {label: _finite(cost) for label, cost in zip(graph.node_labels, costs)}
+    nodes = {}
+    for label in targets:
+        node = graph.label_index.get(label)
+        if node is not None:
+            nodes[label] = node
+    # Stops as soon as the last requested target is settled instead of sweeping the whole graph
+    costs = dijkstra_csr(offsets, targets_csr, weights, source_node, graph.node_count, stop_at=nodes.values())
+    return {label: _finite(costs[node]) for label, node in nodes.items()}
+
+
+def _finite(cost):
+    return None if cost == float('inf') else cost  # JSON has no infinity
+
+
+def _best_move(board, player, rows, cols, k):
+    if len(board) != rows * cols or set(board) - {"X", "O", " "} or player not in ("X", "O"):
+        raise ValueError(f"Expected a {rows * cols}-cell board of 'X', 'O' and ' ', and player 'X' or 'O'")
+    solvers = _engines["solvers"]
+    solver = solvers.get((rows, cols, k))
+    if solver is None:
+        solver = solvers[(rows, cols, k)] = MNKSolver(rows, cols, k)
+    score, move = solver.solve(list(board), player)
+    return {"move": move, "score": score}
+
+
+def _parse(request):
+    """(op, hashable args) for a query; identical (op, args) pairs are coalesced."""
+    op = request.get("op")
+    if op == "grid_path":
+        return op, (tuple(request["start"]), tuple(request["goal"]))
+    if op == "distances":
+        targets = request.get("targets")
+        return op, (str(request["source"]), None if targets is None else tuple(map(str, targets)))
+    if op == "best_move":
+        board = "".join(request["board"])
+        rows, cols, k = request.get("rows", 3), request.get("cols", 3), request.get("k", 3)
+        # The solver is exhaustive: larger boards would hold a pool worker for minutes or more
+        if not all(isinstance(value, int) for value in (rows, cols, k)) \
+                or not (rows >= 1 and cols >= 1 and rows * cols <= MAX_SOLVER_CELLS and 1 <= k <= max(rows, cols)):
+            raise ValueError(f"best_move needs rows * cols <= {MAX_SOLVER_CELLS} and 1 <= k <= max(rows, cols)")
+        return op, (board, request["player"], rows, cols, k)
+    raise ValueError(f"Unknown op {op!r}")
+
+
+class PathService:
+    """
+    The dispatching core, independent of the socket handling.
+
+    Queries go into one bounded job queue drained by one dispatcher task per
+    pool worker, so the pool never holds more than a job per process and a
+    full queue makes query() wait. Distance queries first pass through a
+    bounded batching queue, where those collected within batch_ms are
+    grouped by source into one job each.
+
+    coalesce=False and batch_ms=0 turn the two optimisations off, for comparison.
+    """
+
+    def __init__(self, pool, workers, queue_size=256, batch_ms=2.0, max_batch=64, coalesce=True):
+        self.pool = pool
+        self.workers = workers
+        self.batch_window = batch_ms / 1000
+        self.max_batch = max_batch
+        self.coalesce = coalesce
+        self.jobs = asyncio.Queue(queue_size)  # (function, args, future)
+        self.distance_queries = asyncio.Queue(queue_size)  # (source, targets, future)
+        self.in_flight = {}  # (op, args) -> future of the computation already running for it
+        self.stats = {"queries": 0, "jobs": 0, "coalesced": 0, "batched": 0, "errors": 0}
+        self.tasks = []
+
+    def start(self):
+        self.tasks = [asyncio.create_task(self._dispatch()) for _ in range(self.workers)]
+        self.tasks.append(asyncio.create_task(self._batch_distances()))
+
+    async def stop(self):
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    async def query(self, op, args):
+        self.stats["queries"] += 1
+        key = (op, args)
+        future = self.in_flight.get(key) if self.coalesce else None
+        if future is not None:
+            self.stats["coalesced"] += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            if op == "distances" and self.batch_window > 0:
+                await self.distance_queries.put((*args, future))
+            elif op == "distances":
+                # A batch of one, so unknown targets are reported the same way with batching off
+                shared = asyncio.get_running_loop().create_future()
+                shared.add_done_callback(lambda done: self._split_distances(done, [(args[1], future)]))
+                await self.jobs.put((_distances, args, shared))
+            else:
+                await self.jobs.put(({"grid_path": _grid_path, "distances": _distances,
+                                      "best_move": _best_move}[op], args, future))
+            # Published only once queued: a caller cancelled while waiting on a full queue
+            # must not leave behind a future that nothing will ever resolve
+            if self.coalesce and key not in self.in_flight:
+                self.in_flight[key] = future
+                future.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        # Shielded: a client hanging up must not cancel a result others are waiting for
+        return await asyncio.shield(future)
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            function, args, future = await self.jobs.get()
+            self.stats["jobs"] += 1
+            try:
+                result = await loop.run_in_executor(self.pool, function, *args)
+            except Exception as error:
+                if not future.done():
+                    future.set_exception(error)
+            else:
+                if not future.done():
+                    future.set_result(result)
+
+    async def _batch_distances(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.distance_queries.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.distance_queries.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            by_source = {}
+            for source, targets, future in batch:
+                by_source.setdefault(source, []).append((targets, future))
+            for source, waiting in by_source.items():
+                self.stats["batched"] += len(waiting) - 1
+                if any(targets is None for targets, _ in waiting):
+                    union = None
+                else:
+                    union = tuple({label: None for targets, _ in waiting for label in targets})
+                shared = loop.create_future()
+                shared.add_done_callback(lambda done, waiting=waiting: self._split_distances(done, waiting))
+                await self.jobs.put((_distances, (source, union), shared))
+
+    @staticmethod
+    def _split_distances(shared, waiting):
+        """Hand each query of a batch its own targets from the shared result; an unknown target is an error."""
+        error = shared.exception()
+        for targets, future in waiting:
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+                continue
+            costs = shared.result()
+            if targets is None:
+                future.set_result(costs)
+                continue
+            missing = [label for label in targets if label not in costs]
+            if missing:
+                future.set_exception(ValueError(f"{missing[0]!r} is not a node label"))
+            else:
+                future.set_result({label: costs[label] for label in targets})
+
+    async def handle_connection(self, reader, writer, max_pending=64):
+        """Answer one client; at most max_pending of its queries are in progress before reading stops."""
+        slots = asyncio.Semaphore(max_pending)
+        write_lock = asyncio.Lock()
+        answering = set()
+        try:
+            try:
+                while True:
+                    await slots.acquire()
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    task = asyncio.create_task(self._answer(line, writer, write_lock))
+                    task.add_done_callback(lambda done: (answering.discard(done), slots.release()))
+                    answering.add(task)
+                await asyncio.gather(*answering)
+            finally:
+                for task in answering:
+                    task.cancel()
+                writer.close()
+                await writer.wait_closed()
+        except (ConnectionError, asyncio.CancelledError):
+            # Client hung up, or the service is shutting down. Ending quietly also keeps
+            # asyncio from logging the cancelled handler as an unhandled exception.
+            pass
+
+    async def _answer(self, line, writer, write_lock):
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            if request.get("op") == "stats":
+                answer = {"id": request_id, "result": self.stats}
+            else:
+                answer = {"id": request_id, "result": await self.query(*_parse(request))}
+        except Exception as error:  # Bad request or failed search: report it, keep the connection
+            self.stats["errors"] += 1
+            answer = {"id": request_id, "error": f"{type(error).__name__}: {error}"}
+        async with write_lock:
+            writer.write(json.dumps(answer).encode() + b"\n")
+            await writer.drain()
+
+
+async def serve(host="127.0.0.1", port=8765, unix_path=None, workers=None, grid_size=256, grid_seed=0,
+                graph_path=None, queue_size=256, batch_ms=2.0, coalesce=True, ready=None, grid_path=None):
+    """
+    Run the service until cancelled. Without graph_path a 100x100
+    road_network is saved to a temporary graph file for the workers to map,
+    and without grid_path grid_path queries run on random_layout(grid_size, grid_seed).
+    ready: optional asyncio.Future, given the bound server once it is listening.
+    """
+    workers = workers or os.cpu_count() or 1
+    with tempfile.TemporaryDirectory() as directory:
+        if graph_path is None:
+            graph_path = os.path.join(directory, "roads.wgraph")
+            road_network(100, "csr", grid_seed).save(graph_path)
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_start_worker,
+                                 initargs=(grid_size, grid_seed, graph_path, grid_path)) as pool:
+            service = PathService(pool, workers, queue_size=queue_size, batch_ms=batch_ms, coalesce=coalesce)
+            service.start()
+            limit = 1 << 20  # Longest request line, for distance queries with many targets
+            if unix_path is not None:
+                server = await asyncio.start_unix_server(service.handle_connection, unix_path, limit=limit)
+            else:
+                server = await asyncio.start_server(service.handle_connection, host, port, limit=limit)
+            try:
+                async with server:
+                    if ready is not None:
+                        ready.set_result(server)
+                    await server.serve_forever()
+            finally:
+                await service.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--workers", type=int, default=None, help="default: one per CPU")
+    parser.add_argument("--grid", help="layout file for grid_path, rows of '#' walls and '.' open cells")
+    parser.add_argument("--grid-size", type=int, default=256, help="random grid used without --grid")
+    parser.add_argument("--grid-seed", type=int, default=0)
+    parser.add_argument("--graph", help="graph file from WeightedGraph.save or import_edge_list")
+    parser.add_argument("--queue-size", type=int, default=256)
+    parser.add_argument("--batch-ms", type=float, default=2.0, help="0 turns distance batching off")
+    parser.add_argument("--no-coalesce", action="store_true")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers, args.grid_size, args.grid_seed,
+                          args.graph, args.queue_size, args.batch_ms, not args.no_coalesce, grid_path=args.grid))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+import random
+
+import numpy as np
+
+from ai_snake_game import COLS, ROWS
+
+# Same order SnakeGameAI.ai_decision tries them in, as (dx, dy)
+DIRECTIONS = np.array([(1, 0), (-1, 0), (0, 1), (0, -1)], dtype=np.int64)
+UNREACHED = np.iinfo(np.int32).max
+
+
+class SnakeBatch:
+    """
+    N independent snake games stepped in lockstep on NumPy arrays, no window.
+
+    Each game keeps its body in a ring buffer of cell indices (y * cols + x)
+    plus an occupancy bitmap. ai_decision reproduces SnakeGameAI's BFS
+    policy for every game at once by growing a distance field out from the
+    food; the first direction (in SnakeGameAI's order) whose neighbour is
+    closest is exactly the first step of the BFS path from the head.
+
+    Free cells are tracked in a per-game swap-remove list updated in the
+    same order as SnakeGameAI's, and every game owns a random.Random(seed)
+    used the same way as SnakeGameAI(seed).spawn_food, so game i replays
+    SnakeGameAI(seeds[i], cols, rows, reuse_path=False) move for move. The
+    default SnakeGameAI (reuse_path=True) follows cached routes, which can
+    break ties differently: compare against it with reuse_path=False.
+    Finished games are reset in place and their score and length appended
+    to episode_scores / episode_lengths.
+
+    Throughput, 1000 games on 20x20 boards: about 45k steps/s with the BFS
+    policy, whose distance field costs a pass over the board per BFS layer,
+    and about 1.2M steps/s with actions supplied by the caller. Millions of
+    steps per second are only reached with external actions.
+    """
+
+    def __init__(self, num_envs, seeds=None, cols=COLS, rows=ROWS):
+        if seeds is None:
+            seeds = [random.randrange(2 ** 63) for _ in range(num_envs)]
+        self.num_envs = num_envs
+        self.cols, self.rows = cols, rows
+        self.cells = cols * rows
+        self.rngs = [random.Random(seed) for seed in seeds]
+        self.envs = np.arange(num_envs)
+
+        self.body = np.zeros((num_envs, self.cells), dtype=np.int64)  # Ring buffer, body[head] is the head
+        self.head = np.zeros(num_envs, dtype=np.int64)
+        self.length = np.zeros(num_envs, dtype=np.int64)
+        self.occupied = np.zeros((num_envs, self.cells), dtype=bool)
+        self.free_cells = np.zeros((num_envs, self.cells), dtype=np.int64)
+        self.free_index = np.zeros((num_envs, self.cells), dtype=np.int64)
+        self.free_count = np.zeros(num_envs, dtype=np.int64)
+        self.food = np.zeros(num_envs, dtype=np.int64)  # -1 once the snake fills the board
+        self.direction = np.zeros(num_envs, dtype=np.int64)  # Index into DIRECTIONS
+        self.score = np.zeros(num_envs, dtype=np.int64)
+        self.steps = np.zeros(num_envs, dtype=np.int64)
+        self.episode_scores = []
+        self.episode_lengths = []
+        for env in range(num_envs):
+            self._reset(env)
+
+    def _reset(self, env):
+        start = self.rows // 2 * self.cols + self.cols // 2  # SnakeGameAI's start, the centre
+        self.occupied[env] = False
+        self.free_cells[env] = np.arange(self.cells)
+        self.free_index[env] = np.arange(self.cells)
+        self.free_count[env] = self.cells
+        self.head[env] = 0
+        self.body[env, 0] = start
+        self.length[env] = 1
+        self._occupy(np.array([env]), np.array([start]))
+        self.direction[env] = 0
+        self._spawn_food(env)
+        self.score[env] = 0
+        self.steps[env] = 0
+
+    def _occupy(self, envs, cells):
+        # One cell per game, so the fancy-indexed swap-removes never collide
+        self.occupied[envs, cells] = True
+        index = self.free_index[envs, cells]
+        last = self.free_cells[envs, self.free_count[envs] - 1]
+        self.free_cells[envs, index] = last
+        self.free_index[envs, last] = index
+        self.free_count[envs] -= 1
+
+    def _vacate(self, envs, cells):
+        self.occupied[envs, cells] = False
+        self.free_index[envs, cells] = self.free_count[envs]
+        self.free_cells[envs, self.free_count[envs]] = cells
+        self.free_count[envs] += 1
+
+    def _spawn_food(self, env):
+        # Same random call on the same free list as SnakeGameAI.spawn_food
+        count = self.free_count[env]
+        self.food[env] = self.free_cells[env, self.rngs[env].randrange(count)] if count else -1
+
+    def heads(self):
+        return self.body[self.envs, self.head]
+
+    def ai_decision(self):
+        """Set every game's direction the way SnakeGameAI.ai_decision would."""
+        rows, cols = self.rows, self.cols
+        heads = self.heads()
+        # Padded coordinates of the four neighbours of each head, the border is never free
+        neighbor_y = (heads // cols + 1)[:, None] + DIRECTIONS[:, 1]
+        neighbor_x = (heads % cols + 1)[:, None] + DIRECTIONS[:, 0]
+
+        free = np.zeros((self.num_envs, rows + 2, cols + 2), dtype=bool)
+        free[:, 1:-1, 1:-1] = ~self.occupied.reshape(self.num_envs, rows, cols)
+        neighbor_free = free[self.envs[:, None], neighbor_y, neighbor_x]
+
+        # Grow a BFS layer at a time from the food until each head has a reachable neighbour
+        dist = np.full(free.shape, UNREACHED, dtype=np.int32)
+        frontier = np.zeros(free.shape, dtype=bool)
+        has_food = self.envs[self.food >= 0]
+        food = self.food[has_food]
+        frontier[has_food, food // cols + 1, food % cols + 1] = True
+        dist[has_food, food // cols + 1, food % cols + 1] = 0
+        neighbor_dist = np.full((self.num_envs, 4), UNREACHED, dtype=np.int32)
+
+        active = self.envs  # Games still searching, arrays below are compacted to them
+        layer = 0
+        while len(active):
+            local = np.arange(len(active))
+            reached = dist[local[:, None], neighbor_y, neighbor_x]
+            finished = (reached < UNREACHED).any(axis=1) | ~frontier.any(axis=(1, 2))
+            if finished.any():
+                neighbor_dist[active[finished]] = reached[finished]
+                keep = ~finished
+                active, frontier, dist, free = active[keep], frontier[keep], dist[keep], free[keep]
+                neighbor_y, neighbor_x = neighbor_y[keep], neighbor_x[keep]
+                if not len(active):
+                    break
+
+            layer += 1
+            grown = np.zeros_like(frontier)
+            grown[:, 1:-1, 1:-1] = (frontier[:, :-2, 1:-1] | frontier[:, 2:, 1:-1]
+                                    | frontier[:, 1:-1, :-2] | frontier[:, 1:-1, 2:])
+            frontier = grown & free & (dist == UNREACHED)
+            dist[frontier] = layer
+
+        best = neighbor_dist.min(axis=1)
+        has_path = best < UNREACHED
+        toward_food = np.argmax(neighbor_dist == best[:, None], axis=1)
+        # No path: first free neighbour, like the survival fallback; fully boxed in keeps going
+        any_free = neighbor_free.any(axis=1)
+        first_free = np.argmax(neighbor_free, axis=1)
+        self.direction = np.where(has_path, toward_food, np.where(any_free, first_free, self.direction))
+
+    def step(self, actions=None):
+        """
+        Advance every game one move. actions: optional array of DIRECTIONS
+        indices; by default the built-in BFS policy decides.
+        Returns (ate, done) boolean arrays for this step.
+        """
+        if actions is None:
+            self.ai_decision()
+        else:
+            self.direction = np.asarray(actions, dtype=np.int64)
+        cols, cells, envs = self.cols, self.cells, self.envs
+
+        heads = self.heads()
+        move = DIRECTIONS[self.direction]
+        new_x, new_y = heads % cols + move[:, 0], heads // cols + move[:, 1]
+        inside = (new_x >= 0) & (new_x < cols) & (new_y >= 0) & (new_y < self.rows)
+        new_head = np.where(inside, new_y * cols + new_x, 0)
+        # Checked before the tail moves, like SnakeGameAI.step
+        done = ~inside | self.occupied[envs, new_head]
+
+        alive = envs[~done]
+        moved = new_head[alive]
+        self.head[alive] = (self.head[alive] - 1) % cells
+        self.body[alive, self.head[alive]] = moved
+        self._occupy(alive, moved)
+        self.length[alive] += 1
+        self.steps[alive] += 1
+
+        ate = ~done & (new_head == self.food)
+        self.score[ate] += 1
+        for env in np.flatnonzero(ate):
+            self._spawn_food(env)
+
+        shrink = envs[~done & ~ate]
+        tail = self.body[shrink, (self.head[shrink] + self.length[shrink] - 1) % cells]
+        self._vacate(shrink, tail)
+        self.length[shrink] -= 1
+
+        for env in np.flatnonzero(done):
+            self.episode_scores.append(int(self.score[env]))
+            self.episode_lengths.append(int(self.steps[env]))
+            self._reset(env)
+        return ate, done
+
+
+if __name__ == "__main__":
+    import time
+
+    from ai_snake_game import SnakeGameAI
+
+    # The batch must replay the single-game AI exactly for the same seeds
+    seeds = list(range(8))
+    batch = SnakeBatch(len(seeds), seeds)
+    games = [SnakeGameAI(seed, reuse_path=False) for seed in seeds]
+    for _ in range(2000):
+        batch.step()
+        for game in games:
+            game.ai_decision()
+            if not game.step():
+                game.reset()
+    assert [game.score for game in games] == batch.score.tolist()
+    print("Batch matches SnakeGameAI over 2000 steps")
+
+    # Small and non-square boards start in the centre too
+    for cols, rows in ((1, 1), (2, 3), (5, 5), (7, 6)):
+        batch = SnakeBatch(len(seeds), seeds, cols, rows)
+        games = [SnakeGameAI(seed, cols, rows, reuse_path=False) for seed in seeds]
+        for _ in range(300):
+            batch.step()
+            for game in games:
+                game.ai_decision()
+                if not game.step():
+                    game.reset()
+        assert [game.score for game in games] == batch.score.tolist()
+    print("Batch matches SnakeGameAI on 1x1 to 7x6 boards")
+
+    for num_envs in (1000, 10000):
+        batch = SnakeBatch(num_envs, range(num_envs))
+        start = time.perf_counter()
+        for _ in range(50):
+            batch.step()
+        elapsed = time.perf_counter() - start
+        print(f"{num_envs} games, BFS policy: {50 * num_envs / elapsed:,.0f} steps/s")
+
+        start = time.perf_counter()
+        actions = np.random.default_rng(0).integers(0, 4, size=(200, num_envs))
+        for step_actions in actions:
+            batch.step(step_actions)
+        elapsed = time.perf_counter() - start
+        print(f"{num_envs} games, external actions: {200 * num_envs / elapsed:,.0f} steps/s")
@@ -0,0 +1,167 @@
+"""
+Headless tournament runner: seeded snake or air-hockey AI episodes across a process pool.
+
+    python tournament.py snake --episodes 2000 --planner survival --json snake.json
+    python tournament.py air-hockey --episodes 1000 --frames 3600 --csv hockey.csv
+
+Episodes run without a window or frame-rate cap. Episode i uses seed
+--seed + i, so a report can be reproduced exactly and compared against the
+previous one to catch score or throughput regressions.
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from ai_snake_game import BFS, SURVIVAL, SnakeGameAI, play
+from air_hockey_physics import AI_GOAL, HEIGHT, PADDLE_SPEED, WIDTH, Paddle, Puck
+
+# Columns of the per-episode rows, the same for both games
+EPISODE_FIELDS = ("seed", "score", "length", "decisions", "decision_seconds", "seconds", "outcome")
+
+
+def snake_episode(seed, size, planner, max_steps, reuse_path=True):
+    game = SnakeGameAI(seed, size, size, reuse_path=reuse_path, planner=planner)
+    start = time.perf_counter()
+    score, decisions, thinking, outcome = play(game, stall_limit=2 * size * size, max_steps=max_steps)
+    return {
+        "seed": seed,
+        "score": score,
+        "length": decisions,
+        "decisions": decisions,
+        "decision_seconds": thinking,
+        "seconds": time.perf_counter() - start,
+        "outcome": outcome,
+    }
+
+
+def air_hockey_episode(seed, frames, goals, opponent, predictive=False):
+    """
+    The AI paddle against either the tracking AI mirrored onto the left
+    ("mirror") or a paddle jittering at random ("random"); score is AI goals
+    minus opponent goals.
+    """
+    rng = random.Random(seed)
+    player = Paddle(50, HEIGHT // 2)
+    ai = Paddle(WIDTH - 50, HEIGHT // 2, is_ai=True, predictive=predictive)
+    puck = Puck(WIDTH // 2, HEIGHT // 2, rng)
+    ai_goals = player_goals = 0
+    thinking = 0.0
+    start = time.perf_counter()
+    frame = 0
+    while frame < frames and max(ai_goals, player_goals) < goals:
+        frame += 1
+        if opponent == "mirror":
+            player.ai_move(puck)
+        else:
+            player.move(rng.choice((-PADDLE_SPEED, 0, PADDLE_SPEED)))
+        t = time.perf_counter()
+        ai.ai_move(puck)
+        thinking += time.perf_counter() - t
+        scorer = puck.move(player, ai)
+        if scorer == AI_GOAL:
+            ai_goals += 1
+        elif scorer is not None:
+            player_goals += 1
+    return {
+        "seed": seed,
+        "score": ai_goals - player_goals,
+        "length": frame,
+        "decisions": frame,
+        "decision_seconds": thinking,
+        "seconds": time.perf_counter() - start,
+        "outcome": f"{ai_goals}-{player_goals}",
+    }
+
+
+def summarize(values):
+    ordered = sorted(values)
+    if not ordered:
+        return dict.fromkeys(("mean", "stdev", "min", "p50", "p90", "max"))
+    return {
+        "mean": statistics.fmean(ordered),
+        "stdev": statistics.pstdev(ordered),
+        "min": ordered[0],
+        "p50": ordered[len(ordered) // 2],
+        "p90": ordered[min(len(ordered) - 1, len(ordered) * 9 // 10)],
+        "max": ordered[-1],
+    }
+
+
+def run_tournament(episode, seeds, workers=None):
+    """Run episode(seed) for every seed in a process pool; returns (episode rows, report dict)."""
+    seeds = list(seeds)
+    workers = workers or os.cpu_count()
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, len(seeds) // (4 * workers))
+        rows = list(pool.map(episode, seeds, chunksize=chunksize))
+    wall = time.perf_counter() - start
+
+    decisions = sum(row["decisions"] for row in rows)
+    outcomes = {}
+    for row in rows:
+        outcomes[row["outcome"]] = outcomes.get(row["outcome"], 0) + 1
+    report = {
+        "episodes": len(rows),
+        "wall_seconds": wall,
+        "score": summarize([row["score"] for row in rows]),
+        "length": summarize([row["length"] for row in rows]),
+        # Time inside the policy only, and whole episodes per second of wall clock across the pool
+        "decisions_per_second": decisions / max(sum(row["decision_seconds"] for row in rows), 1e-9),
+        "episodes_per_second": len(rows) / wall,
+        "outcomes": outcomes,
+    }
+    return rows, report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("game", choices=("snake", "air-hockey"))
+    parser.add_argument("--episodes", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="default: one per CPU")
+    parser.add_argument("--size", type=int, default=20, help="snake board size")
+    parser.add_argument("--planner", choices=(BFS, SURVIVAL), default=BFS, help="snake planner")
+    parser.add_argument("--no-reuse-path", action="store_true",
+                        help="snake: search every step, the policy snake_batch.SnakeBatch replays")
+    parser.add_argument("--max-steps", type=int, default=20000, help="snake steps per episode")
+    parser.add_argument("--frames", type=int, default=3600, help="air-hockey frames per episode")
+    parser.add_argument("--goals", type=int, default=7, help="air-hockey goals that end an episode")
+    parser.add_argument("--opponent", choices=("random", "mirror"), default="random", help="air-hockey opponent")
+    parser.add_argument("--ai", choices=("tracking", "predictive"), default="tracking", help="air-hockey AI")
+    parser.add_argument("--json", help="write the summary report here")
+    parser.add_argument("--csv", help="write one row per episode here")
+    args = parser.parse_args()
+
+    if args.game == "snake":
+        episode = partial(snake_episode, size=args.size, planner=args.planner, max_steps=args.max_steps,
+                          reuse_path=not args.no_reuse_path)
+        config = {"size": args.size, "planner": args.planner, "max_steps": args.max_steps,
+                  "reuse_path": not args.no_reuse_path}
+    else:
+        episode = partial(air_hockey_episode, frames=args.frames, goals=args.goals, opponent=args.opponent,
+                          predictive=args.ai == "predictive")
+        config = {"frames": args.frames, "goals": args.goals, "opponent": args.opponent, "ai": args.ai}
+    seeds = range(args.seed, args.seed + args.episodes)
+    rows, report = run_tournament(episode, seeds, args.workers)
+    report = {"game": args.game, "seed": args.seed, **config, **report}
+
+    print(json.dumps(report, indent=2))
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.csv:
+        with open(args.csv, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=EPISODE_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    main()
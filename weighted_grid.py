@@ -0,0 +1,252 @@
+import heapq
+
+from grid_astar import CLOSED, OPENED, PATH, WALL, GridAStar
+
+# Layout characters: "." is open ground costing 1 to enter, "1"-"9" cost that much, "#" is a wall
+TERRAIN_COSTS = {".": 1, **{str(cost): cost for cost in range(1, 10)}}
+
+
+class WeightedGridAStar(GridAStar):
+    """
+    A* on a grid whose cells have small integer costs of entering them (road,
+    mud, water...), with 0 meaning a wall.
+
+    find_path keeps its open list in a bucket queue (Dial's algorithm): one
+    list per f value, in a ring just long enough for the largest jump in f
+    a single step can make, so pushes and pops are O(1) amortised where a
+    heap pays O(log n). That only works because costs are small integers
+    and the heuristic (Manhattan distance times the cheapest cell cost) is
+    consistent, so f never drops below the bucket being emptied.
+    find_path_heap is the same search on heapq, for comparison.
+    """
+
+    def __init__(self, rows, cols, weights):
+        self.weights = bytearray(weights)  # Cost of entering each cell, 0 = wall
+        super().__init__(rows, cols, bytearray(weight == 0 for weight in self.weights))
+        present = set(self.weights) - {0}
+        self.min_weight = min(present, default=1)
+        self.max_weight = max(present, default=1)
+        self.cost = None  # Cost of the last path found
+
+    @classmethod
+    def from_layout(cls, layout, costs=TERRAIN_COSTS):
+        """Build from rows of characters, looked up in costs; "#" (or anything missing) is a wall."""
+        rows, cols = len(layout), len(layout[0])
+        weights = bytearray(0 if cell == WALL else costs.get(cell, 0) for row in layout for cell in row)
+        return cls(rows, cols, weights)
+
+    @classmethod
+    def from_grid(cls, grid):
+        """Build from a 2D grid of Node objects or characters: walls as in GridAStar.from_grid, every other cell costs 1."""
+        rows, cols = len(grid), len(grid[0])
+        weights = bytearray(
+            not (cell == WALL or (hasattr(cell, "is_barrier") and cell.is_barrier()))
+            for row in grid for cell in row
+        )
+        return cls(rows, cols, weights)
+
+    def set_weight(self, row, col, weight):
+        cell = row * self.cols + col
+        self.weights[cell] = weight
+        self.blocked[cell] = weight == 0
+        # Bounds may only loosen: a lower minimum keeps the heuristic admissible, a higher
+        # maximum keeps the bucket ring long enough
+        if weight:
+            self.min_weight = min(self.min_weight, weight)
+            self.max_weight = max(self.max_weight, weight)
+
+    def set_blocked(self, row, col, blocked=True):
+        self.set_weight(row, col, 0 if blocked else 1)
+
+    def _begin(self, start, goal):
+        """Reset the search state; returns (start cell, goal cell) or None if either is a wall."""
+        cols = self.cols
+        start_index = start[0] * cols + start[1]
+        goal_index = goal[0] * cols + goal[1]
+        self.cost = None
+        if self.blocked[start_index] or self.blocked[goal_index]:
+            return None
+        generation = self._next_generation()
+        self.g_score[start_index] = 0
+        self.came_from[start_index] = -1
+        self.stamp[start_index] = generation
+        return start_index, goal_index
+
+    def find_path(self, start, goal):
+        """Same contract as GridAStar.find_path; the path's cost is left in self.cost."""
+        cells = self._begin(start, goal)
+        if cells is None:
+            return None
+        start_index, goal_index = cells
+        rows, cols = self.rows, self.cols
+        weights, g_score, came_from, stamp = self.weights, self.g_score, self.came_from, self.stamp
+        generation = self.generation
+        goal_row, goal_col = goal
+        min_weight = self.min_weight
+
+        # f grows by at most max_weight + min_weight per step, so that many buckets can't wrap
+        ring = self.max_weight + min_weight + 1
+        buckets = [[] for _ in range(ring)]
+        f = min_weight * (abs(goal_row - start[0]) + abs(goal_col - start[1]))
+        buckets[f % ring].append(start_index)
+        pending = 1
+        expanded = 0
+
+        while pending:
+            bucket = buckets[f % ring]
+            if not bucket:
+                f += 1
+                continue
+            current = bucket.pop()
+            pending -= 1
+            row, col = divmod(current, cols)
+            g = g_score[current]
+            if g + min_weight * (abs(goal_row - row) + abs(goal_col - col)) != f:
+                continue  # Stale entry, the cell was re-pushed with a lower f
+            if current == goal_index:
+                self.expanded = expanded
+                self.cost = g
+                return self._reconstruct(current)
+            expanded += 1
+
+            for neighbor, n_row, n_col, inside in ((current - cols, row - 1, col, row > 0),
+                                                   (current + cols, row + 1, col, row < rows - 1),
+                                                   (current - 1, row, col - 1, col > 0),
+                                                   (current + 1, row, col + 1, col < cols - 1)):
+                if not inside:
+                    continue
+                weight = weights[neighbor]
+                if not weight:
+                    continue
+                n_g = g + weight
+                if stamp[neighbor] != generation or n_g < g_score[neighbor]:
+                    stamp[neighbor] = generation
+                    g_score[neighbor] = n_g
+                    came_from[neighbor] = current
+                    n_f = n_g + min_weight * (abs(goal_row - n_row) + abs(goal_col - n_col))
+                    buckets[n_f % ring].append(neighbor)
+                    pending += 1
+
+        self.expanded = expanded
+        return None
+
+    def search_events(self, start, goal):
+        """
+        find_path as an event stream, like GridAStar.search_events: cells are
+        opened and closed in order of weighted f, and self.cost is set once
+        the path is yielded.
+        """
+        cells = self._begin(start, goal)
+        if cells is None:
+            return
+        start_index, goal_index = cells
+        rows, cols = self.rows, self.cols
+        weights, g_score, came_from, stamp = self.weights, self.g_score, self.came_from, self.stamp
+        generation = self.generation
+        goal_row, goal_col = goal
+        min_weight = self.min_weight
+
+        ring = self.max_weight + min_weight + 1
+        buckets = [[] for _ in range(ring)]
+        f = min_weight * (abs(goal_row - start[0]) + abs(goal_col - start[1]))
+        buckets[f % ring].append(start_index)
+        pending = 1
+        yield OPENED, start[0], start[1]
+
+        while pending:
+            bucket = buckets[f % ring]
+            if not bucket:
+                f += 1
+                continue
+            current = bucket.pop()
+            pending -= 1
+            row, col = divmod(current, cols)
+            g = g_score[current]
+            if g + min_weight * (abs(goal_row - row) + abs(goal_col - col)) != f:
+                continue  # Stale entry
+            if current == goal_index:
+                self.cost = g
+                for path_row, path_col in self._reconstruct(current):
+                    yield PATH, path_row, path_col
+                return
+            yield CLOSED, row, col
+
+            for neighbor, n_row, n_col, inside in ((current - cols, row - 1, col, row > 0),
+                                                   (current + cols, row + 1, col, row < rows - 1),
+                                                   (current - 1, row, col - 1, col > 0),
+                                                   (current + 1, row, col + 1, col < cols - 1)):
+                if not inside:
+                    continue
+                weight = weights[neighbor]
+                if not weight:
+                    continue
+                n_g = g + weight
+                if stamp[neighbor] != generation or n_g < g_score[neighbor]:
+                    stamp[neighbor] = generation
+                    g_score[neighbor] = n_g
+                    came_from[neighbor] = current
+                    n_f = n_g + min_weight * (abs(goal_row - n_row) + abs(goal_col - n_col))
+                    buckets[n_f % ring].append(neighbor)
+                    pending += 1
+                    yield OPENED, n_row, n_col
+
+    def find_path_heap(self, start, goal):
+        """find_path with a binary heap for the open list instead of buckets."""
+        cells = self._begin(start, goal)
+        if cells is None:
+            return None
+        start_index, goal_index = cells
+        rows, cols = self.rows, self.cols
+        weights, g_score, came_from, stamp = self.weights, self.g_score, self.came_from, self.stamp
+        generation = self.generation
+        goal_row, goal_col = goal
+        min_weight = self.min_weight
+
+        open_heap = [(min_weight * (abs(goal_row - start[0]) + abs(goal_col - start[1])), start_index)]
+        expanded = 0
+
+        while open_heap:
+            f, current = heapq.heappop(open_heap)
+            row, col = divmod(current, cols)
+            g = g_score[current]
+            if g + min_weight * (abs(goal_row - row) + abs(goal_col - col)) != f:
+                continue  # Stale entry
+            if current == goal_index:
+                self.expanded = expanded
+                self.cost = g
+                return self._reconstruct(current)
+            expanded += 1
+
+            for neighbor, n_row, n_col, inside in ((current - cols, row - 1, col, row > 0),
+                                                   (current + cols, row + 1, col, row < rows - 1),
+                                                   (current - 1, row, col - 1, col > 0),
+                                                   (current + 1, row, col + 1, col < cols - 1)):
+                if not inside:
+                    continue
+                weight = weights[neighbor]
+                if not weight:
+                    continue
+                n_g = g + weight
+                if stamp[neighbor] != generation or n_g < g_score[neighbor]:
+                    stamp[neighbor] = generation
+                    g_score[neighbor] = n_g
+                    came_from[neighbor] = current
+                    n_f = n_g + min_weight * (abs(goal_row - n_row) + abs(goal_col - n_col))
+                    heapq.heappush(open_heap, (n_f, neighbor))
+
+        self.expanded = expanded
+        return None
+
+
+if __name__ == "__main__":
+    # A wall column with a gap at the bottom, built from a Node-style grid
+    engine = WeightedGridAStar.from_grid([[".", "#", "."], [".", "#", "."], [".", ".", "."]])
+    assert engine.find_path((0, 0), (0, 2)) == [(0, 0), (1, 0), (2, 0), (2, 1), (2, 2), (1, 2), (0, 2)]
+
+    # The event stream must follow the weights: go around the water, not through it
+    engine = WeightedGridAStar.from_layout(["...", ".9.", "..."])
+    events = list(engine.search_events((1, 0), (1, 2)))
+    streamed = [(row, col) for kind, row, col in events if kind == PATH]
+    assert engine.cost == 4 and (1, 1) not in streamed
+    assert streamed == engine.find_path((1, 0), (1, 2))
+    print(f"Weighted search events: {len(events)} events, path cost {engine.cost}")